@@ -67,7 +67,12 @@ class App(metaclass=DocsMeta):
         """
         return self.router.include(router, prefix=prefix)
 
-    def mount(self, prefix: str, app: typing.Union["App", ASGIApp, WSGIApp]):
+    def mount(
+        self,
+        prefix: str,
+        app: typing.Union["App", ASGIApp, WSGIApp],
+        name: str = None,
+    ):
         """Mount another WSGI or ASGI app at the given prefix.
 
         [WSGI]: https://wsgi.readthedocs.io
@@ -78,16 +83,56 @@ class App(metaclass=DocsMeta):
             a path prefix where the app should be mounted, e.g. `"/myapp"`.
         app:
             an object implementing the [WSGI] or [ASGI] protocol.
+        name (str):
+            an optional name for the mounted app. If given, URLs of files
+            served by the app can be built with `url_for(name, path=...)`,
+            and the routes of a mounted Bocadillo app are available to
+            `url_for()` as `"<name>:<route name>"`.
         """
-        return self.router.mount(prefix, app)
+        return self.router.mount(prefix, app, name=name)
 
-    def route(self, pattern: str, methods: typing.List[str] = None):
+    def route(
+        self, pattern: str, methods: typing.List[str] = None, name: str = None
+    ):
         """Register an HTTP route by decorating a view.
 
         # Parameters
         pattern (str): an URL pattern.
+        methods (list of str): the HTTP methods of a function-based view.
+        name (str):
+            a name used to build URLs with [url_for](#url-for).
+            Defaults to the name of the view.
+        """
+        return self.router.route(pattern, methods=methods, name=name)
+
+    def url_for(self, name: str, **params: typing.Any) -> str:
+        """Build the URL path of a named route.
+
+        URL formats are computed once for all routes, which makes this
+        suitable for generating many links, e.g. in templates.
+
+        # Example
+
+        ```python
+        @app.route("/items/{pk:int}")
+        async def get_item(req, res, pk):
+            pass
+
+        app.url_for("get_item", pk=42)  # "/items/42"
+        ```
+
+        # Parameters
+        name (str): the name of a route.
+        **params (any): values for the route parameters.
+
+        # Returns
+        path (str): a URL path.
+
+        # Raises
+        LookupError: if no route has the given name.
+        TypeError: if parameters are missing or unexpected.
         """
-        return self.router.route(pattern, methods=methods)
+        return self.router.url_for(name, **params)
 
     def websocket_route(
         self,
@@ -98,6 +143,7 @@ class App(metaclass=DocsMeta):
         receive_type: str = None,
         send_type: str = None,
         caught_close_codes: typing.Tuple[int] = None,
+        name: str = None,
     ):
         """Register a WebSocket route by decorating a view.
 
@@ -106,6 +152,9 @@ class App(metaclass=DocsMeta):
 
         # Parameters
         pattern (str): an URL pattern.
+        name (str):
+            a name used to build URLs with [url_for](#url-for).
+            Defaults to the name of the view.
         """
         return self.router.websocket_route(
             pattern,
@@ -114,6 +163,7 @@ class App(metaclass=DocsMeta):
             receive_type=receive_type,
             send_type=send_type,
             caught_close_codes=caught_close_codes,
+            name=name,
         )
 
     def add_error_handler(
@@ -0,0 +1,314 @@
+import hashlib
+import json
+import time
+import typing
+from collections import OrderedDict
+
+from .app_types import Receive, Scope, Send
+from .hooks import after
+from .middleware import Middleware
+from .request import Request
+from .response import Response
+
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+class CacheBackend:
+    """Base class for response cache backends.
+
+    Backends store bytes under string keys for a limited amount of time.
+    Subclasses must implement `.get()` and `.set()`, and may implement
+    `.delete()` and `.clear()`.
+
+    # Example
+
+    A backend for a Redis-like store may look like this:
+
+    ```python
+    from bocadillo.cache import CacheBackend
+
+    class RedisBackend(CacheBackend):
+        def __init__(self, redis):
+            self.redis = redis
+
+        async def get(self, key):
+            return await self.redis.get(key)
+
+        async def set(self, key, value, ttl):
+            await self.redis.set(key, value, expire=ttl)
+    ```
+    """
+
+    async def get(self, key: str) -> typing.Optional[bytes]:
+        """Return the value stored under `key`, if any and not expired."""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """Remove the value stored under `key`, if any."""
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        """Remove all stored values."""
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """An in-process LRU cache backend.
+
+    # Parameters
+    max_size (int):
+        the maximum total size of stored keys and values, in bytes.
+        When it is exceeded, least recently used values are evicted.
+        Defaults to 64MB.
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: typing.Dict[str, typing.Tuple[float, bytes]] = (
+            OrderedDict()
+        )
+
+    async def get(self, key: str) -> typing.Optional[bytes]:
+        try:
+            expires_at, value = self._entries[key]
+        except KeyError:
+            return None
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._remove(key)
+        size = len(key) + len(value)
+        if size > self.max_size:
+            return
+        while self.size + size > self.max_size:
+            self._remove(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self.size += size
+
+    async def delete(self, key: str) -> None:
+        self._remove(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(key) + len(entry[1])
+
+
+def _get_directives(cache_control: str) -> typing.Dict[str, str]:
+    directives = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def get_ttl(
+    res: Response, default: typing.Optional[float] = None
+) -> typing.Optional[float]:
+    # Return how long a response can be kept in a shared cache, in seconds.
+    directives = _get_directives(res.headers.get("cache-control", ""))
+    if {"private", "no-store", "no-cache"} & directives.keys():
+        return None
+    for name in ("s-maxage", "max-age"):
+        if name in directives:
+            try:
+                return int(directives[name])
+            except ValueError:
+                return None
+    return default
+
+
+def cache(ttl: int):
+    """Cache the responses of a view for the given number of seconds.
+
+    This sets the `s-maxage` directive of the `Cache-Control` header, which
+    is honored by #::bocadillo.cache#CacheMiddleware as well as by other
+    shared caches such as proxies and CDNs.
+
+    This decorator can be applied to function-based views, class-based views
+    and individual methods of class-based views.
+
+    # Parameters
+    ttl (int): for how long responses should be cached, in seconds.
+
+    # Example
+
+    ```python
+    from bocadillo.cache import cache
+
+    @app.route("/")
+    @cache(60)
+    async def index(req, res):
+        res.text = "Hello, world!"
+    ```
+    """
+
+    async def set_cache_control(req: Request, res: Response, params: dict):
+        directives = res.headers.get("cache-control")
+        directive = f"s-maxage={ttl}"
+        if directives is None:
+            res.headers["cache-control"] = directive
+        elif "s-maxage" not in directives:
+            res.headers["cache-control"] = f"{directives}, {directive}"
+
+    return after(set_cache_control)
+
+
+class CacheMiddleware(Middleware):
+    """Cache responses on the server side.
+
+    Responses to `GET` and `HEAD` requests are stored based on the request
+    method, path and query string, as well as the values of the request
+    headers listed in the response's `Vary` header. Cached responses are sent
+    without routing the request or calling the view.
+
+    A response is cached if it is a `200 OK` response, it does not set cookies,
+    it is not a file or streaming response, and its `Cache-Control` header
+    defines an `s-maxage` or `max-age` (see #::bocadillo.cache#cache), or the
+    middleware has a default `ttl`. Responses marked as `private`,
+    `no-store` or `no-cache` are never cached.
+
+    # Parameters
+    inner (callable): the inner middleware.
+    backend (CacheBackend):
+        where responses should be stored.
+        Defaults to a #::bocadillo.cache#MemoryBackend.
+    ttl (int):
+        for how long responses whose `Cache-Control` header doesn't
+        say otherwise should be cached, in seconds.
+        Defaults to `None`, i.e. only cache responses that explicitly
+        allow it.
+    max_size (int):
+        passed to `MemoryBackend` if no `backend` is given.
+    """
+
+    def __init__(
+        self,
+        inner,
+        backend: CacheBackend = None,
+        ttl: typing.Optional[int] = None,
+        max_size: int = None,
+    ):
+        super().__init__(inner)
+        if backend is None:
+            backend = (
+                MemoryBackend()
+                if max_size is None
+                else MemoryBackend(max_size=max_size)
+            )
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def _get_base_key(scope: Scope) -> str:
+        path = scope.get("root_path", "") + scope["path"]
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        return f"{scope['method']}:{path}?{query_string}"
+
+    @staticmethod
+    def _get_key(base_key: str, req: Request, vary: typing.List[str]) -> str:
+        if not vary:
+            return base_key
+        values = "\n".join(req.headers.get(name, "") for name in vary)
+        digest = hashlib.sha1(values.encode("latin-1")).hexdigest()
+        return f"{base_key}#{digest}"
+
+    async def _load(
+        self, base_key: str, req: Request
+    ) -> typing.Optional[Response]:
+        vary = await self.backend.get("vary:" + base_key)
+        if vary is None:
+            return None
+
+        data = await self.backend.get(
+            self._get_key(base_key, req, json.loads(vary))
+        )
+        if data is None:
+            return None
+
+        meta, _, content = data.partition(b"\n")
+        status_code, headers, etag = json.loads(meta)
+
+        res = Response(req)
+        res.status_code = status_code
+        res.headers = headers
+        res.etag = etag
+        res.content = content
+        return res
+
+    async def _store(self, base_key: str, req: Request, res: Response):
+        if (
+            (res.status_code or 200) != 200
+            or res._file_path is not None  # pylint: disable=protected-access
+            or res._stream is not None  # pylint: disable=protected-access
+            or "set-cookie" in res.headers
+        ):
+            return
+
+        ttl = get_ttl(res, default=self.ttl)
+        if not ttl or ttl <= 0:
+            return
+
+        vary = [
+            name.strip().lower()
+            for name in res.headers.get("vary", "").split(",")
+            if name.strip()
+        ]
+        if "*" in vary:
+            return
+
+        content = res.content if res.content is not None else b""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        meta = json.dumps([res.status_code, res.headers, res.etag])
+
+        await self.backend.set(
+            "vary:" + base_key, json.dumps(vary).encode(), ttl
+        )
+        await self.backend.set(
+            self._get_key(base_key, req, vary),
+            meta.encode() + b"\n" + content,
+            ttl,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        assert scope["type"] == "http"
+
+        if scope["method"] not in CACHEABLE_METHODS:
+            await self.inner(scope, receive, send)
+            return
+
+        req = scope["req"]
+        # NOTE: routing may alter the scope, so build the key beforehand.
+        base_key = self._get_base_key(scope)
+
+        res = await self._load(base_key, req)
+        if res is not None:
+            scope["res"] = res
+            return
+
+        response_started = False
+
+        async def sentinel_send(message: dict):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        await self.inner(scope, receive, sentinel_send)
+
+        if not response_started:
+            await self._store(base_key, req, scope["res"])
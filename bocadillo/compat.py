@@ -1,5 +1,9 @@
+import asyncio
 import inspect
 import typing
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from starlette.middleware.wsgi import build_environ
 
 try:
     # >= 3.7
@@ -60,3 +64,133 @@ def empty_wsgi_app() -> WSGIApp:
         return [body]
 
     return wsgi
+
+
+def is_wsgi(app: typing.Callable) -> bool:
+    """Return whether `app` looks like a WSGI app rather than an ASGI app.
+
+    WSGI apps are synchronous callables which accept exactly two positional
+    arguments: `environ` and `start_response`.
+    """
+    func = app if inspect.isroutine(app) else getattr(app, "__call__", None)
+    if func is None or inspect.iscoroutinefunction(func):
+        return False
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):  # pragma: no cover
+        return False
+    positional = [
+        param
+        for param in parameters
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+    ]
+    return len(positional) == 2
+
+
+_WSGI_EXECUTOR: typing.Optional[Executor] = None
+
+
+def get_wsgi_executor() -> typing.Optional[Executor]:
+    # Return the thread pool shared by all WSGI apps, created on first use.
+    # If `None`, the event loop's default executor is used.
+    global _WSGI_EXECUTOR  # pylint: disable=global-statement
+    if _WSGI_EXECUTOR is None:
+        from .config import settings  # prevent circular imports
+
+        max_workers = settings.get("WSGI_MAX_WORKERS")
+        if max_workers is not None:
+            _WSGI_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="bocadillo-wsgi"
+            )
+    return _WSGI_EXECUTOR
+
+
+class WSGIAdapter:
+    """Serve a WSGI app over ASGI.
+
+    The WSGI app is run in a thread pool, and chunks of the response are
+    sent as they are produced.
+
+    # Parameters
+    app (callable): a WSGI app.
+    executor (Executor):
+        the thread pool the app should run in. Defaults to a pool shared by
+        all WSGI apps, whose size is set by the `WSGI_MAX_WORKERS` setting.
+        If this setting is not set, the event loop's default executor is
+        used.
+    """
+
+    __slots__ = ("app", "executor")
+
+    def __init__(self, app: WSGIApp, executor: Executor = None):
+        self.app = app
+        self.executor = executor
+
+    async def __call__(self, scope, receive, send):
+        assert scope["type"] == "http"
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        environ = build_environ(scope, body)
+        loop = asyncio.get_event_loop()
+        messages: asyncio.Queue = asyncio.Queue()
+        exc_info = None
+
+        def put(message: typing.Optional[dict]):
+            loop.call_soon_threadsafe(messages.put_nowait, message)
+
+        def start_response(status: str, response_headers, info=None):
+            nonlocal exc_info
+            exc_info = info
+            status_code, _ = status.split(" ", 1)
+            headers = [
+                (name.encode("latin1"), value.encode("latin1"))
+                for name, value in response_headers
+            ]
+            put(
+                {
+                    "type": "http.response.start",
+                    "status": int(status_code),
+                    "headers": headers,
+                }
+            )
+
+        def run():
+            iterable = self.app(environ, start_response)
+            try:
+                for chunk in iterable:
+                    put(
+                        {
+                            "type": "http.response.body",
+                            "body": chunk,
+                            "more_body": True,
+                        }
+                    )
+                put({"type": "http.response.body", "body": b""})
+            finally:
+                # See: https://www.python.org/dev/peps/pep-3333/
+                if hasattr(iterable, "close"):
+                    iterable.close()
+
+        async def sender():
+            while True:
+                message = await messages.get()
+                if message is None:
+                    return
+                await send(message)
+
+        sending = loop.create_task(sender())
+        try:
+            executor = self.executor or get_wsgi_executor()
+            await loop.run_in_executor(executor, run)
+        finally:
+            messages.put_nowait(None)
+            await sending
+
+        if exc_info is not None:
+            raise exc_info[1].with_traceback(exc_info[2])
@@ -0,0 +1,66 @@
+import typing
+import zlib
+from email.utils import parsedate_to_datetime
+
+# See: https://tools.ietf.org/html/rfc7232
+
+
+def make_etag(content: bytes, weak: bool = False) -> str:
+    """Compute an entity tag from the content of a response.
+
+    A CRC32 checksum is used instead of a cryptographic hash, as it is
+    much faster to compute. The length of the content is included to
+    further reduce the risk of collisions.
+
+    # Parameters
+    content (bytes): the response body.
+    weak (bool): whether to return a weak entity tag. Defaults to `False`.
+
+    # Returns
+    etag (str): a quoted entity tag, e.g. `"3a2f9c1e-1b"`.
+    """
+    etag = f'"{zlib.crc32(content):08x}-{len(content):x}"'
+    return "W/" + etag if weak else etag
+
+
+def _strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # `If-None-Match` uses the weak comparison function.
+    if if_none_match.strip() == "*":
+        return True
+    etag = _strip_weak(etag)
+    return any(
+        _strip_weak(tag.strip()) == etag for tag in if_none_match.split(",")
+    )
+
+
+def is_not_modified(
+    if_none_match: typing.Optional[str],
+    if_modified_since: typing.Optional[str],
+    etag: typing.Optional[str],
+    last_modified: typing.Optional[str],
+) -> bool:
+    """Return whether a `304 Not Modified` response should be sent.
+
+    # Parameters
+    if_none_match (str): the request's `If-None-Match` header, if any.
+    if_modified_since (str): the request's `If-Modified-Since` header, if any.
+    etag (str): the response's `ETag` header, if any.
+    last_modified (str): the response's `Last-Modified` header, if any.
+    """
+    if if_none_match is not None:
+        # `If-Modified-Since` must be ignored if `If-None-Match` is present.
+        return etag is not None and etag_matches(if_none_match, etag)
+
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+            modified = parsedate_to_datetime(last_modified)
+            return modified <= since
+        except (TypeError, ValueError):
+            return False
+
+    return False
@@ -21,9 +21,20 @@ class PathConversionError(typesystem.ValidationError):
     pass
 
 
+def get_field(annotation: typing.Any) -> typing.Optional[typesystem.Field]:
+    # Find the TypeSystem field for a parameter's annotation.
+    if isinstance(annotation, typesystem.Field):
+        return annotation
+    try:
+        return FIELD_ALIASES[annotation]()
+    except (KeyError, TypeError):
+        # NOTE: `TypeError` is raised for unhashable annotations.
+        return None
+
+
 class Converter:
 
-    __slots__ = ("func", "signature", "annotations", "required_params")
+    __slots__ = ("func", "signature", "annotations", "required_params", "plan")
 
     def __init__(self, func: typing.Callable):
         self.func = func
@@ -40,25 +51,38 @@ class Converter:
             if param.default is inspect.Parameter.empty
         )
 
-    def convert(self, args: tuple, kwargs: dict) -> typing.Tuple[tuple, dict]:
-        bound: inspect.BoundArguments = self.signature.bind(*args, **kwargs)
-
-        errors: typing.List[typesystem.ValidationError] = []
-
-        for param_name, value in bound.arguments.items():
-            try:
-                annotation = self.annotations[param_name]
-            except KeyError:
+        # Precompute which parameters need validation, where to find their
+        # values in `(args, kwargs)`, and the field that validates them.
+        # This spares us binding the signature on every call.
+        plan = []
+        for position, param in enumerate(self.signature.parameters.values()):
+            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
                 continue
+            field = get_field(self.annotations.get(param.name))
+            if field is None:
+                continue
+            if param.kind not in (
+                param.POSITIONAL_ONLY,
+                param.POSITIONAL_OR_KEYWORD,
+            ):
+                position = None
+            plan.append((param.name, position, field))
+        self.plan: typing.Tuple[tuple, ...] = tuple(plan)
 
-            # Find the TypeSystem field for the parameter's annotation.
-            if isinstance(annotation, typesystem.Field):
-                field = annotation
+    def convert(self, args: tuple, kwargs: dict) -> typing.Tuple[tuple, dict]:
+        errors: typing.List[typesystem.ValidationError] = []
+        converted_args: typing.Optional[list] = None
+
+        for param_name, position, field in self.plan:
+            # NOTE: parameters that were not given are skipped, so that
+            # default values are not validated.
+            # It's faster and less bug-prone.
+            if param_name in kwargs:
+                value = kwargs[param_name]
+            elif position is not None and position < len(args):
+                value = args[position]
             else:
-                try:
-                    field = FIELD_ALIASES[annotation]()
-                except KeyError:
-                    continue
+                continue
 
             # Perform validation.
             try:
@@ -67,17 +91,22 @@ class Converter:
                 # NOTE: `add_prefix` sets the key of the error in the final
                 # error's dict representation.
                 errors.extend(exc.messages(add_prefix=param_name))
+                continue
+
+            if param_name in kwargs:
+                kwargs[param_name] = value
             else:
-                bound.arguments[param_name] = value
+                if converted_args is None:
+                    converted_args = list(args)
+                converted_args[position] = value
 
         if errors:
             raise PathConversionError(messages=errors)
 
-        # NOTE: apply defaults last to prevent validating the default values.
-        # It's faster and less bug-prone.
-        bound.apply_defaults()
+        if converted_args is not None:
+            args = tuple(converted_args)
 
-        return bound.args, bound.kwargs
+        return args, kwargs
 
 
 class ViewConverter(Converter):
@@ -87,7 +116,7 @@ class ViewConverter(Converter):
     def __init__(self, func: typing.Callable):
         super().__init__(func)
 
-        self.query_parameters = set(
+        self.query_parameters = tuple(
             param.name
             for param in self.signature.parameters.values()
             if param.default is not inspect.Parameter.empty
@@ -97,11 +126,12 @@ class ViewConverter(Converter):
         raise NotImplementedError
 
     def convert(self, args: tuple, kwargs: dict) -> typing.Tuple[tuple, dict]:
-        query_params = self.get_query_params(args, kwargs)
+        if self.query_parameters:
+            query_params = self.get_query_params(args, kwargs)
 
-        for param_name in self.query_parameters:
-            if param_name in query_params:
-                kwargs[param_name] = query_params[param_name]
+            for param_name in self.query_parameters:
+                if param_name in query_params:
+                    kwargs[param_name] = query_params[param_name]
 
         return super().convert(args, kwargs)
 
@@ -111,6 +141,10 @@ def convert_arguments(
 ) -> typing.Callable:
     converter = converter_class(func)
 
+    if not converter.plan and not getattr(converter, "query_parameters", ()):
+        # Nothing to convert: call the function directly.
+        return func
+
     @wraps(func)
     async def converted(*args, **kwargs):
         args, kwargs = converter.convert(args, kwargs)
@@ -0,0 +1,320 @@
+import binascii
+import hashlib
+import mmap
+import os
+import stat
+import typing
+from email.utils import formatdate
+from mimetypes import guess_type
+
+from starlette.background import BackgroundTask
+from starlette.responses import Response as _Response
+
+from .config import settings
+
+# See: https://asgi.readthedocs.io/en/latest/extensions.html#zero-copy-send
+ZEROCOPY = "http.response.zerocopy"
+
+
+def get_chunk_size() -> int:
+    return settings.get("FILE_CHUNK_SIZE", 64 * 1024)
+
+
+async def send_file(
+    scope: dict,
+    send: typing.Callable,
+    file: typing.BinaryIO,
+    offset: int = 0,
+    count: int = None,
+    chunk_size: int = None,
+    more_body: bool = False,
+):
+    """Send (part of) an open file as the body of an HTTP response.
+
+    If the server supports the zero-copy send extension, the file is handed
+    over to the server, which can send it using `os.sendfile()`. Otherwise,
+    the file is memory-mapped and sent in chunks.
+
+    # Parameters
+    scope (dict): the ASGI scope.
+    send (callable): the ASGI `send` callable.
+    file (file object): a file opened in binary mode.
+    offset (int): where to start reading the file from. Defaults to `0`.
+    count (int):
+        how many bytes to send. Defaults to sending the rest of the file.
+    chunk_size (int):
+        how many bytes to send at a time when the zero-copy extension is
+        not available. Defaults to the `FILE_CHUNK_SIZE` setting (64kB).
+    more_body (bool):
+        whether more of the response body will be sent afterwards.
+        Defaults to `False`.
+    """
+    size = os.fstat(file.fileno()).st_size
+    end = size if count is None else min(offset + count, size)
+
+    if ZEROCOPY in scope.get("extensions", {}):
+        await send(
+            {
+                "type": ZEROCOPY,
+                "file": file,
+                "offset": offset,
+                "count": max(end - offset, 0),
+                "more_body": more_body,
+            }
+        )
+        return
+
+    if end <= offset:
+        # Empty files cannot be memory-mapped.
+        await send(
+            {"type": "http.response.body", "body": b"", "more_body": more_body}
+        )
+        return
+
+    if chunk_size is None:
+        chunk_size = get_chunk_size()
+
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for start in range(offset, end, chunk_size):
+            stop = min(start + chunk_size, end)
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": mapped[start:stop],
+                    "more_body": stop < end or more_body,
+                }
+            )
+
+
+def parse_range(
+    value: str, size: int
+) -> typing.Optional[typing.List[typing.Tuple[int, int]]]:
+    """Parse the value of a `Range` header.
+
+    # Parameters
+    value (str): the value of the `Range` header, e.g. `"bytes=0-499"`.
+    size (int): the size of the file, in bytes.
+
+    # Returns
+    ranges (list):
+        the satisfiable `(start, end)` byte ranges (bounds are inclusive),
+        possibly empty. `None` if the header is invalid and should be ignored.
+    """
+    unit, _, specs = value.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+
+    ranges = []
+
+    for spec in specs.split(","):
+        first, sep, last = spec.strip().partition("-")
+        if not sep:
+            return None
+        try:
+            if not first:
+                # Suffix range, e.g. `bytes=-500`.
+                length = int(last)
+                if length > 0 and size > 0:
+                    ranges.append((max(size - length, 0), size - 1))
+                continue
+            start = int(first)
+            end = int(last) if last else size - 1
+        except ValueError:
+            return None
+        if last and end < start:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+
+    return ranges
+
+
+def if_range_matches(value: str, etag: str, last_modified: str) -> bool:
+    # See: https://tools.ietf.org/html/rfc7233#section-3.2
+    value = value.strip()
+    if value.startswith("W/"):
+        return False  # Weak validators must not be used for ranges.
+    return value in (etag, last_modified)
+
+
+class ByteRanges:
+    """A `multipart/byteranges` body made of several ranges of a file.
+
+    # Parameters
+    ranges (list): a list of `(start, end)` byte ranges.
+    size (int): the size of the file, in bytes.
+    content_type (str): the content type of the file.
+
+    # Attributes
+    content_type (str): the content type of the multipart body.
+    content_length (int): the length of the multipart body, in bytes.
+    """
+
+    def __init__(
+        self,
+        ranges: typing.List[typing.Tuple[int, int]],
+        size: int,
+        content_type: str,
+    ):
+        boundary = binascii.hexlify(os.urandom(16)).decode()
+        self.content_type = f"multipart/byteranges; boundary={boundary}"
+        self.parts = [
+            (
+                (
+                    f"--{boundary}\r\n"
+                    f"content-type: {content_type}\r\n"
+                    f"content-range: bytes {start}-{end}/{size}\r\n\r\n"
+                ).encode("latin-1"),
+                start,
+                end,
+            )
+            for start, end in ranges
+        ]
+        self.trailer = f"--{boundary}--\r\n".encode("latin-1")
+        self.content_length = len(self.trailer) + sum(
+            len(head) + end - start + 1 + 2 for head, start, end in self.parts
+        )
+
+    async def send(
+        self,
+        scope: dict,
+        send: typing.Callable,
+        file: typing.BinaryIO,
+        chunk_size: int = None,
+    ):
+        """Send the multipart body."""
+        for head, start, end in self.parts:
+            await send(
+                {"type": "http.response.body", "body": head, "more_body": True}
+            )
+            await send_file(
+                scope,
+                send,
+                file,
+                offset=start,
+                count=end - start + 1,
+                chunk_size=chunk_size,
+                more_body=True,
+            )
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": b"\r\n",
+                    "more_body": True,
+                }
+            )
+        await send({"type": "http.response.body", "body": self.trailer})
+
+
+class FileResponse(_Response):
+    # Send a file using `send_file()`.
+    # This mirrors Starlette's `FileResponse`, which reads files using
+    # `aiofiles` and needs a thread hop for each chunk.
+
+    def __init__(
+        self,
+        path: str,
+        headers: dict = None,
+        background: BackgroundTask = None,
+        method: str = None,
+    ):
+        self.path = path
+        self.status_code = 200
+        self.background = background
+        self.send_header_only = method == "HEAD"
+        self.media_type = guess_type(path)[0] or "text/plain"
+        self.init_headers(headers)
+
+    def set_stat_headers(self, stat_result: os.stat_result):
+        content_length = str(stat_result.st_size)
+        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+        etag_base = str(stat_result.st_mtime) + "-" + str(stat_result.st_size)
+        etag = hashlib.md5(etag_base.encode()).hexdigest()
+
+        self.headers.setdefault("content-length", content_length)
+        self.headers.setdefault("last-modified", last_modified)
+        self.headers.setdefault("etag", etag)
+
+    def get_ranges(
+        self, scope: dict, size: int
+    ) -> typing.Optional[typing.List[typing.Tuple[int, int]]]:
+        # Return the byte ranges requested by the client, if any.
+        if scope.get("method") != "GET":
+            return None
+
+        range_header = if_range = None
+        for key, value in scope.get("headers", []):
+            if key == b"range":
+                range_header = value.decode("latin-1")
+            elif key == b"if-range":
+                if_range = value.decode("latin-1")
+
+        if range_header is None:
+            return None
+
+        if if_range is not None and not if_range_matches(
+            if_range, self.headers["etag"], self.headers["last-modified"]
+        ):
+            return None
+
+        return parse_range(range_header, size)
+
+    async def __call__(self, scope, receive, send):
+        try:
+            file = open(self.path, "rb")
+        except FileNotFoundError:
+            raise RuntimeError(f"File at path {self.path} does not exist.")
+        except IsADirectoryError:
+            raise RuntimeError(f"File at path {self.path} is not a file.")
+
+        with file:
+            stat_result = os.fstat(file.fileno())
+            if not stat.S_ISREG(stat_result.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+            self.set_stat_headers(stat_result)
+            self.headers.setdefault("accept-ranges", "bytes")
+
+            ranges = self.get_ranges(scope, stat_result.st_size)
+            byteranges: typing.Optional[ByteRanges] = None
+
+            if ranges == []:
+                self.status_code = 416
+                self.headers["content-range"] = f"bytes */{stat_result.st_size}"
+                self.headers["content-length"] = "0"
+            elif ranges and len(ranges) == 1:
+                self.status_code = 206
+                start, end = ranges[0]
+                self.headers["content-range"] = (
+                    f"bytes {start}-{end}/{stat_result.st_size}"
+                )
+                self.headers["content-length"] = str(end - start + 1)
+            elif ranges:
+                self.status_code = 206
+                byteranges = ByteRanges(
+                    ranges, stat_result.st_size, self.headers["content-type"]
+                )
+                self.headers["content-type"] = byteranges.content_type
+                self.headers["content-length"] = str(byteranges.content_length)
+
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+
+            if self.send_header_only or self.status_code == 416:
+                await send({"type": "http.response.body", "body": b""})
+            elif byteranges is not None:
+                await byteranges.send(scope, send, file)
+            elif ranges:
+                start, end = ranges[0]
+                await send_file(
+                    scope, send, file, offset=start, count=end - start + 1
+                )
+            else:
+                await send_file(scope, send, file)
+
+        if self.background is not None:
+            await self.background()
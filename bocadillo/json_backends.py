@@ -0,0 +1,156 @@
+import json
+import typing
+
+from .config import settings
+
+
+class JSONBackend:
+    """Base class for JSON backends.
+
+    A JSON backend encodes Python objects to JSON and decodes them back.
+    It is used by `res.json`, `req.json()`, `server_event(json=...)` as well as
+    the `.send_json()` and `.receive_json()` methods of WebSockets.
+
+    Use the `JSON_BACKEND` setting to choose the JSON backend.
+    """
+
+    name: str = ""
+
+    def dumps(self, value: typing.Any) -> str:
+        """Serialize `value` to a JSON string."""
+        raise NotImplementedError
+
+    def dumpb(self, value: typing.Any) -> bytes:
+        """Serialize `value` to UTF-8 encoded JSON bytes."""
+        return self.dumps(value).encode("utf-8")
+
+    def loads(self, data: typing.Union[str, bytes]) -> typing.Any:
+        """Deserialize a JSON string or bytes.
+
+        # Raises
+        ValueError: if `data` is not valid JSON.
+        """
+        raise NotImplementedError
+
+
+class StdlibJSONBackend(JSONBackend):
+    """A JSON backend using the standard library's `json` module."""
+
+    name = "json"
+
+    def dumps(self, value: typing.Any) -> str:
+        return json.dumps(value)
+
+    def loads(self, data: typing.Union[str, bytes]) -> typing.Any:
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """A JSON backend using [orjson](https://github.com/ijl/orjson).
+
+    orjson natively produces `bytes`, which avoids an extra encoding step
+    when sending JSON responses.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson  # pylint: disable=import-error
+
+        self._orjson = orjson
+
+    def dumps(self, value: typing.Any) -> str:
+        return self._orjson.dumps(value).decode("utf-8")
+
+    def dumpb(self, value: typing.Any) -> bytes:
+        return self._orjson.dumps(value)
+
+    def loads(self, data: typing.Union[str, bytes]) -> typing.Any:
+        return self._orjson.loads(data)
+
+
+class UjsonBackend(JSONBackend):
+    """A JSON backend using [ujson](https://github.com/ultrajson/ultrajson)."""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson  # pylint: disable=import-error
+
+        self._ujson = ujson
+
+    def dumps(self, value: typing.Any) -> str:
+        return self._ujson.dumps(value, ensure_ascii=False)
+
+    def loads(self, data: typing.Union[str, bytes]) -> typing.Any:
+        return self._ujson.loads(data)
+
+
+BACKENDS: typing.Dict[str, typing.Type[JSONBackend]] = {
+    backend.name: backend
+    for backend in (StdlibJSONBackend, OrjsonBackend, UjsonBackend)
+}
+
+# Backends tried in turn when `JSON_BACKEND` is `"auto"`.
+AUTO_BACKENDS = ("orjson", "ujson", "json")
+
+_INSTANCES: typing.Dict[str, JSONBackend] = {}
+
+
+def _create_backend(name: str) -> JSONBackend:
+    if name == "auto":
+        for candidate in AUTO_BACKENDS:
+            try:
+                return BACKENDS[candidate]()
+            except ImportError:
+                continue
+
+    try:
+        backend_cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON backend: {name!r}. "
+            f"Expected 'auto' or one of {', '.join(map(repr, BACKENDS))}."
+        ) from None
+
+    return backend_cls()
+
+
+def get_json_backend() -> JSONBackend:
+    """Return the JSON backend selected by the `JSON_BACKEND` setting.
+
+    `JSON_BACKEND` can be:
+
+    - `"json"` (default): the standard library's `json` module.
+    - `"orjson"` or `"ujson"`: the corresponding third-party library, which
+    must be installed.
+    - `"auto"`: the fastest library installed (orjson, then ujson), falling
+    back to the standard library.
+    - A #::bocadillo.json_backends#JSONBackend instance.
+
+    # Raises
+    ValueError: if `JSON_BACKEND` is not a known backend.
+    ImportError: if the library of the backend is not installed.
+    """
+    value = settings.get("JSON_BACKEND", "json")
+
+    if isinstance(value, JSONBackend):
+        return value
+
+    try:
+        return _INSTANCES[value]
+    except KeyError:
+        backend = _INSTANCES[value] = _create_backend(value)
+        return backend
+
+
+def dumps(value: typing.Any) -> str:
+    return get_json_backend().dumps(value)
+
+
+def dumpb(value: typing.Any) -> bytes:
+    return get_json_backend().dumpb(value)
+
+
+def loads(data: typing.Union[str, bytes]) -> typing.Any:
+    return get_json_backend().loads(data)
@@ -1,3 +1,4 @@
+import asyncio
 import typing
 
 from .app_types import ASGIApp, ErrorHandler, Receive, Scope, Send
@@ -170,3 +171,128 @@ class RequestResponseMiddleware:
                 res = scope["res"]
                 refreshed_send = scope.get("send", send)
                 await res(scope, receive, refreshed_send)
+
+
+def get_request_key(req: Request) -> str:
+    """Return a key identifying identical requests.
+
+    The key is built from the request method, path and query string, as well
+    as the `Authorization` and `Cookie` headers so that responses are never
+    shared between users.
+    """
+    headers = req.headers
+    return "\n".join(
+        (
+            req.method,
+            req.url.path,
+            req.url.query,
+            headers.get("authorization", ""),
+            headers.get("cookie", ""),
+        )
+    )
+
+
+def _copy_response(res: Response, req: Request) -> Response:
+    copy = Response(req)
+    copy.status_code = res.status_code
+    copy.headers = dict(res.headers)
+    copy.content = res.content
+    copy.chunked = res.chunked
+    copy.attachment = res.attachment
+    copy.etag = res.etag
+    return copy
+
+
+class SingleFlightMiddleware(Middleware):
+    """Coalesce concurrent identical `GET` and `HEAD` requests.
+
+    While a request is being processed, identical requests wait for it to
+    complete and reuse its response instead of being processed themselves.
+    If the request fails, the same exception is raised for the waiting
+    requests.
+
+    Streaming and file responses cannot be reused: waiting requests are then
+    processed normally.
+
+    # Parameters
+    inner (callable): the inner middleware.
+    key (callable):
+        a function that takes a #::bocadillo.request#Request and returns
+        a string identifying it, or `None` if the request should not be
+        coalesced.
+        Defaults to #::bocadillo.middleware#get_request_key.
+    timeout (float):
+        how long waiting requests should wait for the response, in seconds.
+        If it takes longer, they are processed normally.
+        Defaults to `None`, i.e. wait indefinitely.
+    """
+
+    def __init__(
+        self,
+        inner: ASGIApp,
+        key: typing.Callable[[Request], typing.Optional[str]] = None,
+        timeout: typing.Optional[float] = None,
+    ):
+        super().__init__(inner)
+        self.key = key if key is not None else get_request_key
+        self.timeout = timeout
+        self._flights: typing.Dict[str, asyncio.Future] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        assert scope["type"] == "http"
+
+        req = scope["req"]
+        key = self.key(req) if scope["method"] in ("GET", "HEAD") else None
+
+        if key is None:
+            await self.inner(scope, receive, send)
+            return
+
+        flight = self._flights.get(key)
+
+        if flight is not None:
+            try:
+                res = await asyncio.wait_for(
+                    asyncio.shield(flight), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                res = None
+
+            if res is None:
+                await self.inner(scope, receive, send)
+            else:
+                scope["res"] = _copy_response(res, req)
+            return
+
+        flight = asyncio.get_event_loop().create_future()
+        self._flights[key] = flight
+        response_started = False
+
+        async def sentinel_send(message: dict):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.inner(scope, receive, sentinel_send)
+        except asyncio.CancelledError:
+            # Let waiting requests be processed on their own.
+            flight.set_result(None)
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            # Mark the exception as retrieved in case no request was waiting.
+            flight.exception()
+            raise
+        else:
+            res = scope["res"]
+            reusable = not (
+                response_started
+                or res._stream is not None  # pylint: disable=protected-access
+                or res._file_path
+                is not None  # pylint: disable=protected-access
+            )
+            flight.set_result(res if reusable else None)
+        finally:
+            del self._flights[key]
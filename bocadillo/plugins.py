@@ -110,6 +110,34 @@ def use_gzip(app: "App"):
     app.add_middleware(GZipMiddleware, minimum_size=gzip_min_size)
 
 
+@_builtin
+def use_response_cache(app: "App"):
+    """Enable server-side caching of responses.
+
+    [Response caching]: /guide/builtin-middleware.md#response-caching
+
+    Settings:
+    - `RESPONSE_CACHE` (bool or dict):
+        if `True`, cache responses in memory.
+        Otherwise, it must be a dictionary which will be passed to the
+        #::bocadillo.cache#CacheMiddleware, e.g. `{"ttl": 60}`.
+        Defaults to `False`.
+
+    # See Also
+    - [Response caching]
+    """
+    config = settings.get("RESPONSE_CACHE", False)
+    if not config:
+        return
+
+    from .cache import CacheMiddleware  # prevent circular imports
+
+    if config is True:
+        config = {}
+
+    app.add_middleware(CacheMiddleware, **config)
+
+
 @_builtin
 def use_hsts(app: "App"):
     """Enable [HSTS].
@@ -167,7 +195,7 @@ def use_sessions(app: "App"):
 
 @_builtin
 def use_staticfiles(app: "App"):
-    """Enable static files serving with WhiteNoise.
+    """Enable static files serving.
 
     Settings:
     - `STATIC_DIR` (str):
@@ -177,8 +205,12 @@ def use_staticfiles(app: "App"):
         Defaults to `"static"`.
     - `STATIC_ROOT` (str):
         the path prefix for static assets. Defaults to `"static"`.
+        URLs of static assets can be built with
+        `app.url_for("static", path=...)`.
     - `STATIC_CONFIG` (dict):
-        extra static files configuration attributes.
+        extra static files configuration attributes, e.g.
+        `{"backend": "native"}` to use the native ASGI static files server
+        instead of WhiteNoise.
         See also #::bocadillo.staticfiles#static.
     """
     static_root = settings.get("STATIC_ROOT", "static")
@@ -188,7 +220,7 @@ def use_staticfiles(app: "App"):
     if static_dir is None:
         return
 
-    app.mount(static_root, static(static_dir, **static_config))
+    app.mount(static_root, static(static_dir, **static_config), name="static")
 
 
 @_builtin
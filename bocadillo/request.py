@@ -1,8 +1,9 @@
-from json import JSONDecodeError
 import typing
 
 from starlette.requests import Request as _Request, ClientDisconnect as _CD
 
+from .json_backends import loads
+
 
 ClientDisconnect = _CD
 
@@ -25,15 +26,21 @@ class Request(_Request):
     async def json(self) -> typing.Any:
         """Parse the request body as JSON.
 
+        The body is decoded using the JSON backend selected by the
+        `JSON_BACKEND` setting.
+
         # Returns
-        json (dict): the result of `json.loads(await self.body())`.
+        json (dict): the result of `loads(await self.body())`.
 
         # Raises
         HTTPError(400): if the JSON is malformed.
         """
+        if hasattr(self, "_json"):
+            return self._json
         try:
-            return await super().json()
-        except JSONDecodeError:
+            self._json = loads(await self.body())
+            return self._json
+        except ValueError:
             from .errors import HTTPError  # prevent circular imports
 
             raise HTTPError(400, detail="JSON is malformed.")
@@ -1,17 +1,25 @@
 from functools import partial
 from os.path import basename
-import json
 import typing
 
 from starlette.background import BackgroundTask
 from starlette.requests import Request
-from starlette.responses import FileResponse as _FileResponse
 from starlette.responses import Response as _Response
 from starlette.responses import StreamingResponse as _StreamingResponse
 
+from .conditional import is_not_modified, make_etag
+from .config import settings
 from .constants import CONTENT_TYPE
 from .deprecation import deprecated
-from .streaming import Stream, StreamFunc, stream_until_disconnect
+from .files import FileResponse
+from .json_backends import dumpb
+from .streaming import (
+    Stream,
+    StreamFunc,
+    buffer_stream,
+    json_stream,
+    stream_until_disconnect,
+)
 
 AnyStr = typing.Union[str, bytes]
 BackgroundFunc = typing.Callable[..., typing.Coroutine]
@@ -58,6 +66,12 @@ class Response:
         This is done by setting the [Content-Disposition] header, and
         typically makes the client browser trigger a "Save As…" dialog or
         download and save the file locally.
+    etag (bool or str):
+        whether to generate an `ETag` header from `content` and answer
+        conditional `GET` requests with a `304 Not Modified` response:
+        `True` (or `"strong"`) for a strong entity tag, `"weak"` for a weak
+        one, `False` to disable.
+        If not set, defaults to the `ETAG` setting (`False` by default).
     """
 
     __slots__ = (
@@ -67,6 +81,7 @@ class Response:
         "headers",
         "chunked",
         "attachment",
+        "etag",
         "_file_path",
         "_background",
         "_stream",
@@ -76,10 +91,10 @@ class Response:
     html = _content_setter(CONTENT_TYPE.HTML)
     json = _content_setter(
         CONTENT_TYPE.JSON,
-        serializer=json.dumps,
+        serializer=dumpb,
         doc=(
             "Write-only property that sets `content` to the JSON-serialized "
-            "version of the set value, "
+            "version of the set value (see the `JSON_BACKEND` setting), "
             'and sets the `Content-Type` header to `"application/json".'
         ),
     )
@@ -92,15 +107,20 @@ class Response:
         self.headers: typing.Dict[str, str] = {}
         self.chunked = False
         self.attachment: typing.Optional[str] = None
+        self.etag: typing.Optional[typing.Union[bool, str]] = None
         # Private attributes.
         self._file_path: typing.Optional[str] = None
         self._background: typing.Optional[BackgroundFunc] = None
         self._stream: typing.Optional[Stream] = None
 
     def file(self, path: str, attach: bool = True):
-        """Send a file asynchronously using [aiofiles].
+        """Send a file asynchronously.
 
-        [aiofiles]: https://github.com/Tinche/aiofiles
+        If the server supports the [zero-copy send] ASGI extension, the file
+        is sent using `os.sendfile()`. Otherwise, it is memory-mapped and sent
+        by chunks of `FILE_CHUNK_SIZE` bytes (defaults to 64kB).
+
+        [zero-copy send]: https://asgi.readthedocs.io/en/latest/extensions.html#zero-copy-send
 
         # Parameters
         path (str):
@@ -141,7 +161,11 @@ class Response:
         return None
 
     def stream(
-        self, func: StreamFunc = None, raise_on_disconnect: bool = False
+        self,
+        func: StreamFunc = None,
+        raise_on_disconnect: bool = False,
+        buffer_size: int = 4096,
+        flush_interval: typing.Optional[float] = 0.05,
     ) -> StreamFunc:
         """Stream the response.
 
@@ -152,16 +176,93 @@ class Response:
         is raised in the generator when it `yield`s a chunk but the client
         has disconnected. Otherwise, the exception is handled and the stream
         stops.
+
+        To reduce the number of messages sent to the client, chunks are
+        buffered until there are at least `buffer_size` bytes, or until
+        the oldest chunk has been buffered for `flush_interval` seconds.
+        Yield `bocadillo.streaming.FLUSH` to send buffered chunks right away.
+        Pass `buffer_size=0` to send each chunk as soon as it is yielded.
         """
         if func is None:
-            return partial(self.stream, raise_on_disconnect=raise_on_disconnect)
-
-        self._stream = stream_until_disconnect(
-            self.request, func(), raise_on_disconnect=raise_on_disconnect
+            return partial(
+                self.stream,
+                raise_on_disconnect=raise_on_disconnect,
+                buffer_size=buffer_size,
+                flush_interval=flush_interval,
+            )
+
+        self._stream = buffer_stream(
+            stream_until_disconnect(
+                self.request, func(), raise_on_disconnect=raise_on_disconnect
+            ),
+            buffer_size=buffer_size,
+            flush_interval=flush_interval,
         )
 
         return func
 
+    def json_stream(
+        self,
+        items: typing.Union[typing.Iterable, typing.AsyncIterable],
+        batch_size: int = 4096,
+    ):
+        """Stream items as a JSON array.
+
+        Items are encoded one at a time (see the `JSON_BACKEND` setting),
+        so that large result sets don't need to be held in memory.
+        Small items are batched into chunks of at least `batch_size` bytes.
+
+        If the client disconnects, the stream stops and `items` is closed
+        if it is an asynchronous generator.
+
+        This sets the `Content-Type` header to `"application/json"`.
+
+        # Parameters
+        items (iterable or async iterable): JSON-serializable items.
+        batch_size (int):
+            the minimum size of chunks sent to the client, in bytes.
+            Defaults to `4096`.
+
+        # Example
+
+        ```python
+        @app.route("/items")
+        async def list_items(req, res):
+            res.json_stream(db.fetch_items())
+        ```
+        """
+        self._stream_json(items, CONTENT_TYPE.JSON, False, batch_size)
+
+    def ndjson(
+        self,
+        items: typing.Union[typing.Iterable, typing.AsyncIterable],
+        batch_size: int = 4096,
+    ):
+        """Stream items as newline-delimited JSON.
+
+        This is similar to `.json_stream()`, except that each item is sent on
+        its own line, and the `Content-Type` header is set to
+        `"application/x-ndjson"`.
+
+        # Parameters
+        items (iterable or async iterable): JSON-serializable items.
+        batch_size (int):
+            the minimum size of chunks sent to the client, in bytes.
+            Defaults to `4096`.
+        """
+        self._stream_json(items, CONTENT_TYPE.NDJSON, True, batch_size)
+
+    def _stream_json(
+        self, items, content_type: str, ndjson: bool, batch_size: int
+    ):
+        self.headers["content-type"] = content_type
+        # NOTE: `json_stream()` handles `ClientDisconnect` by closing `items`.
+        self._stream = stream_until_disconnect(
+            self.request,
+            json_stream(items, ndjson=ndjson, batch_size=batch_size),
+            raise_on_disconnect=True,
+        )
+
     def event_stream(self, func: StreamFunc = None, **kwargs) -> StreamFunc:
         """Stream server-sent events.
 
@@ -177,6 +278,10 @@ class Response:
         - `Content-Type: text/event-stream`
         - `Connection: Keep-Alive`
 
+        Unlike `@stream()`, messages are not buffered by default, so that
+        they reach the client as soon as possible. Pass `buffer_size` and
+        `flush_interval` to enable buffering.
+
         # See Also
         - [Using server-sent events (MDN)](https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events/Using_server-sent_events)
         """
@@ -186,6 +291,7 @@ class Response:
             "content-type": "text/event-stream",
             "connection": "keep-alive",
         }
+        kwargs.setdefault("buffer_size", 0)
         return self.stream(func, **kwargs)
 
     async def __call__(self, scope, receive, send):
@@ -193,7 +299,8 @@ class Response:
         if self.status_code is None:
             self.status_code = 200
 
-        if self.status_code != 204:
+        if self.status_code != 204 and self._file_path is None:
+            # NOTE: the content type of files is guessed from their path.
             self.headers.setdefault("content-type", "text/plain")
 
         if self.chunked:
@@ -210,11 +317,16 @@ class Response:
             "background": self._background_task,
         }
 
+        if self._is_not_modified(scope):
+            await self._send_not_modified(send)
+            return
+
         response_cls = _Response
 
         if self._file_path is not None:
-            response_cls = _FileResponse
+            response_cls = FileResponse
             response_kwargs["path"] = self._file_path
+            response_kwargs["method"] = scope.get("method")
             # `FileResponse` will populate the response from `path` and
             # doesn't expect `content` to be passed.
             del response_kwargs["content"]
@@ -226,3 +338,49 @@ class Response:
 
         response: _Response = response_cls(**response_kwargs)
         await response(scope, receive, send)
+
+    def _is_not_modified(self, scope: dict) -> bool:
+        if (
+            scope.get("method") not in ("GET", "HEAD")
+            or self.status_code != 200
+            or self.content is None
+            or self._file_path is not None
+            or self._stream is not None
+        ):
+            return False
+
+        etag = self.etag
+        if etag is None:
+            etag = settings.get("ETAG", False)
+
+        if not etag:
+            return False
+
+        if "etag" not in self.headers:
+            content = self.content
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            self.headers["etag"] = make_etag(content, weak=etag == "weak")
+
+        headers = self.request.headers
+        return is_not_modified(
+            headers.get("if-none-match"),
+            headers.get("if-modified-since"),
+            self.headers.get("etag"),
+            self.headers.get("last-modified"),
+        )
+
+    async def _send_not_modified(self, send):
+        # See: https://tools.ietf.org/html/rfc7232#section-4.1
+        headers = [
+            (key.lower().encode("latin-1"), value.encode("latin-1"))
+            for key, value in self.headers.items()
+            if key.lower() not in ("content-type", "content-length")
+        ]
+        await send(
+            {"type": "http.response.start", "status": 304, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": b""})
+        background = self._background_task
+        if background is not None:
+            await background()
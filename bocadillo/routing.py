@@ -1,15 +1,17 @@
+import re
 import typing
+from collections import OrderedDict
 
 from starlette.datastructures import URL
-from starlette.middleware.wsgi import WSGIMiddleware
 from starlette.routing import Lifespan
 from starlette.websockets import WebSocketClose
 
 from .app_types import ASGIApp, EventHandler, Receive, Scope, Send
+from .compat import WSGIAdapter, is_wsgi
 from .config import settings
 from .errors import HTTPError
 from .redirection import Redirect
-from .urlparse import Parser
+from .urlparse import CATCHALL, COMPLEX, PARAM, STATIC, Parser, compile_path
 from .views import View
 from .websockets import WebSocket, WebSocketView
 
@@ -20,6 +22,10 @@ def _join(prefix: str, path: str) -> str:
     return prefix + path
 
 
+def _get_view_name(view: typing.Any) -> str:
+    return getattr(view, "__name__", type(view).__name__)
+
+
 class BaseRoute(typing.Generic[_V]):
     def matches(self, scope: dict) -> typing.Tuple[bool, dict]:
         raise NotImplementedError
@@ -29,16 +35,20 @@ class BaseRoute(typing.Generic[_V]):
 
 
 class Patterned(typing.Generic[_V]):
-    __slots__ = ("_pattern", "_parser", "view")
+    __slots__ = ("_pattern", "_parser", "view", "name")
 
-    def __init__(self, pattern: str, view: _V):
+    def __init__(self, pattern: str, view: _V, name: str = None):
         self._parser = Parser(pattern)
         self.view = view
+        self.name = name
 
     @property
     def pattern(self) -> str:
         return self._parser.pattern
 
+    def child_scope(self, scope: Scope, params: dict) -> Scope:
+        return {"path_params": params}
+
 
 class HTTPRoute(BaseRoute, Patterned[View]):
     def matches(self, scope: Scope) -> typing.Tuple[bool, Scope]:
@@ -47,7 +57,7 @@ class HTTPRoute(BaseRoute, Patterned[View]):
         params = self._parser.parse(scope["path"])
         if params is None:
             return False, {}
-        return True, {"path_params": params}
+        return True, self.child_scope(scope, params)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         req, res = scope["req"], scope["res"]
@@ -57,8 +67,10 @@ class HTTPRoute(BaseRoute, Patterned[View]):
 class WebSocketRoute(BaseRoute, Patterned[WebSocketView]):
     __slots__ = ("ws_kwargs",)
 
-    def __init__(self, pattern: str, view: WebSocketView, **kwargs):
-        super().__init__(pattern, view)
+    def __init__(
+        self, pattern: str, view: WebSocketView, name: str = None, **kwargs
+    ):
+        super().__init__(pattern, view, name=name)
         self.ws_kwargs = kwargs
 
     def matches(self, scope: Scope) -> typing.Tuple[bool, Scope]:
@@ -67,7 +79,7 @@ class WebSocketRoute(BaseRoute, Patterned[WebSocketView]):
         params = self._parser.parse(scope["path"])
         if params is None:
             return False, {}
-        return True, {"path_params": params}
+        return True, self.child_scope(scope, params)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         ws = WebSocket(scope, receive, send, **self.ws_kwargs)
@@ -75,14 +87,17 @@ class WebSocketRoute(BaseRoute, Patterned[WebSocketView]):
 
 
 class Mount(BaseRoute):
-    def __init__(self, path: str, app: ASGIApp):
+    def __init__(self, path: str, app: ASGIApp, name: str = None):
         if not path.startswith("/"):
             path = "/" + path
         path = path.rstrip("/")
 
         self.app = app
         self.path = path
+        self.name = name
         self._parser = Parser(self.path + "/{path:path}")
+        # Detect the kind of app once, instead of on every request.
+        self._asgi = WSGIAdapter(app) if is_wsgi(app) else app
 
     def matches(self, scope: dict) -> typing.Tuple[bool, dict]:
         path = scope["path"]
@@ -93,56 +108,529 @@ class Mount(BaseRoute):
             params = self._parser.parse(path)
 
         if params is not None:
-            remaining_path = "/" + params["path"]
-            matched_path = path[: -len(remaining_path)]
-            child_scope = {
-                "path": remaining_path,
-                "root_path": scope.get("root_path", "") + matched_path,
-            }
-            return True, child_scope
+            return True, self.child_scope(scope, params)
 
         return False, {}
 
+    def child_scope(self, scope: dict, params: dict) -> dict:
+        remaining_path = "/" + params["path"]
+        matched_path = scope["path"][: -len(remaining_path)]
+        return {
+            "path": remaining_path,
+            "root_path": scope.get("root_path", "") + matched_path,
+        }
+
     async def __call__(self, scope, receive, send):
+        await self._asgi(scope, receive, send)
+
+
+_Found = typing.Tuple[BaseRoute, dict]
+_Match = typing.Tuple[int, BaseRoute, dict]
+
+
+class RouteList:
+    """Find which route matches a path by trying each route in turn."""
+
+    __slots__ = ("_routes",)
+
+    def __init__(self, routes: typing.Iterable[BaseRoute] = ()):
+        self._routes = list(routes)
+
+    def find(self, scope: Scope) -> typing.Optional[_Found]:
+        for route in self._routes:
+            matches, child_scope = route.matches(scope)
+            if matches:
+                return route, child_scope
+        return None
+
+
+class RouteRegex:
+    """Find which route matches a path using a single regex.
+
+    The patterns of all routes are compiled into one alternation of named
+    groups (one per route), so a path is matched with a single call to
+    `re.match()`. As alternatives are tried in order, the route that was
+    registered first wins.
+
+    Routes that aren't defined by an URL pattern are matched separately, in
+    between the compiled alternations that surround them.
+    """
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, routes: typing.Iterable[BaseRoute] = ()):
+        self._chunks: typing.List[tuple] = []
+        alternatives: typing.List[str] = []
+        table: typing.Dict[str, tuple] = {}
+
+        def flush():
+            if alternatives:
+                regex = re.compile("^(?:%s)$" % "|".join(alternatives))
+                self._chunks.append((regex, dict(table)))
+                alternatives.clear()
+                table.clear()
+
+        for index, route in enumerate(routes):
+            parser: typing.Optional[Parser] = getattr(route, "_parser", None)
+
+            if parser is None:
+                flush()
+                self._chunks.append((None, route))
+                continue
+
+            group = f"r{index}"
+            regex, _ = compile_path(parser.source, group_prefix=f"{group}_")
+            # Strip the `^` and `$` anchors. They are added back around
+            # the whole alternation.
+            alternatives.append(f"(?P<{group}>{regex.pattern[1:-1]})")
+            params = [
+                (name, f"{group}_{name}") for name in parser.regex.groupindex
+            ]
+            table[group] = (route, parser, params)
+
+        flush()
+
+    def find(self, scope: Scope) -> typing.Optional[_Found]:
+        path: str = scope["path"]
+
+        for regex, table in self._chunks:
+            if regex is None:
+                route = table
+                matches, child_scope = route.matches(scope)
+                if matches:
+                    return route, child_scope
+                continue
+
+            match = regex.match(path)
+            if match is None:
+                continue
+
+            # NOTE: the route's group encloses its parameter groups, so it
+            # is the last group to be closed.
+            route, parser, params = table[match.lastgroup]
+            params = {name: match.group(group) for name, group in params}
+            return route, route.child_scope(scope, parser.convert(params))
+
+        return None
+
+
+class _Node:
+    # A node of a `RouteTree`.
+
+    __slots__ = (
+        "min_index",
+        "check",
+        "static",
+        "params",
+        "leaves",
+        "tails",
+        "others",
+    )
+
+    def __init__(self, min_index: int, check: typing.Pattern = None):
+        # Index of the first route registered under this node. No route
+        # found in this subtree can have a lower index.
+        self.min_index = min_index
+        # For parameter nodes, the regex of the parameter's converter.
+        # If not set, any non-empty path segment is accepted.
+        self.check = check
+        self.static: typing.Dict[str, "_Node"] = {}
+        # Parameter nodes, indexed by converter regex.
+        self.params: typing.Dict[typing.Optional[str], "_Node"] = {}
+        # Routes whose pattern ends at this node: (index, route, names).
+        self.leaves: typing.List[tuple] = []
+        # Routes ending with a catch-all segment under this node:
+        # (index, route, names, catch-all name).
+        self.tails: typing.List[tuple] = []
+        # Routes whose pattern cannot be decomposed further. They are
+        # matched against the full path using their own regex.
+        self.others: typing.List[typing.Tuple[int, BaseRoute]] = []
+
+
+class RouteTree:
+    """A segment tree used to find which route matches a given path.
+
+    Static path segments are resolved using dict lookups, `{param}` segments
+    map to a child per converter (e.g. `{pk:int}`), and `{}` or `{name:path}`
+    catch-alls
+    (which includes mounted apps) are stored on the node where their prefix
+    ends. Patterns that cannot be split into segments fall back to regex
+    matching at the deepest node their prefix allows.
+
+    When several routes match, the one that was registered first wins.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, routes: typing.Iterable[BaseRoute] = ()):
+        self._root = _Node(0)
+        for index, route in enumerate(routes):
+            self.insert(index, route)
+
+    def insert(self, index: int, route: BaseRoute) -> None:
+        parser: typing.Optional[Parser] = getattr(route, "_parser", None)
+
+        if parser is None:
+            self._root.others.append((index, route))
+            return
+
+        node = self._root
+        names: typing.List[str] = []
+
+        for segment in parser.segments:
+            if segment.kind == STATIC:
+                child = node.static.get(segment.value)
+                if child is None:
+                    child = node.static[segment.value] = _Node(index)
+                node = child
+            elif segment.kind == PARAM:
+                regex = None
+                if segment.converter is not None:
+                    regex = parser.converters[segment.value].regex
+                child = node.params.get(regex)
+                if child is None:
+                    check = None if regex is None else re.compile(regex)
+                    child = node.params[regex] = _Node(index, check)
+                node = child
+                names.append(segment.value)
+            elif segment.kind == CATCHALL:
+                node.tails.append((index, route, names, segment.value))
+                return
+            else:
+                assert segment.kind == COMPLEX
+                node.others.append((index, route))
+                return
+
+        node.leaves.append((index, route, names))
+
+    def find(self, scope: Scope) -> typing.Optional[_Found]:
+        """Find the first registered route that matches the scope.
+
+        # Returns
+        found (tuple): `(route, child_scope)`, or `None`.
+        """
+        path: str = scope["path"]
+        best = self._search(self._root, path.split("/"), 0, [], scope, None)
+        if best is None:
+            return None
+        _, route, child_scope = best
+        return route, child_scope
+
+    def _search(
+        self,
+        node: _Node,
+        parts: typing.List[str],
+        position: int,
+        values: typing.List[str],
+        scope: Scope,
+        best: typing.Optional[_Match],
+    ) -> typing.Optional[_Match]:
+        if best is not None and node.min_index >= best[0]:
+            return best
+
+        for index, route in node.others:
+            if best is not None and index >= best[0]:
+                break
+            matches, child_scope = route.matches(scope)
+            if matches:
+                best = (index, route, child_scope)
+                break
+
+        if position == len(parts):
+            for index, route, names in node.leaves:
+                if best is None or index < best[0]:
+                    params = route._parser.convert(dict(zip(names, values)))
+                    best = (index, route, route.child_scope(scope, params))
+                break
+            return best
+
+        for index, route, names, catchall in node.tails:
+            if best is None or index < best[0]:
+                params = dict(zip(names, values))
+                if catchall is not None:
+                    params[catchall] = "/".join(parts[position:])
+                params = route._parser.convert(params)
+                best = (index, route, route.child_scope(scope, params))
+            break
+
+        part = parts[position]
+        children = []
+        static = node.static.get(part)
+        if static is not None:
+            children.append((static, values))
+        for child in node.params.values():
+            if child.check is None:
+                if not part:
+                    continue
+            elif child.check.fullmatch(part) is None:
+                continue
+            children.append((child, values + [part]))
+        if len(children) > 1:
+            children.sort(key=lambda item: item[0].min_index)
+
+        for child, child_values in children:
+            best = self._search(
+                child, parts, position + 1, child_values, scope, best
+            )
+
+        return best
+
+
+MATCHERS = {"tree": RouteTree, "regex": RouteRegex, "linear": RouteList}
+
+
+class URLFormat(typing.NamedTuple):
+    path_format: str
+    params: typing.FrozenSet[str]
+    converters: typing.Dict[str, typing.Any]
+
+    @classmethod
+    def from_parser(cls, parser: Parser, prefix: str = "") -> "URLFormat":
+        return cls(
+            path_format=prefix + parser.pattern,
+            params=frozenset(parser.regex.groupindex),
+            converters=parser.converters,
+        )
+
+    def build(self, name: str, params: dict) -> str:
+        if params.keys() != self.params:
+            expected = ", ".join(sorted(self.params)) or "none"
+            raise TypeError(
+                f"Route {name!r} expects parameters: {expected}. "
+                f"Got: {', '.join(sorted(params)) or 'none'}."
+            )
+        for param, converter in self.converters.items():
+            params[param] = converter.to_string(params[param])
         try:
-            await self.app(scope, receive, send)
-        except TypeError:
-            app = WSGIMiddleware(self.app)
-            await app(scope, receive, send)
+            return self.path_format.format_map(params)
+        except (IndexError, ValueError) as exc:
+            raise TypeError(
+                f"Route {name!r} contains anonymous parameters, and so "
+                "a URL cannot be built for it."
+            ) from exc
 
 
-class Router:
-    __slots__ = ("routes", "lifespan")
+_MISSING = object()
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
 
-    def __init__(self):
+
+class RouteCache:
+    """A bounded LRU cache of route lookup results.
+
+    Negative results (i.e. no route matched) are cached too.
+
+    # Parameters
+    maxsize (int):
+        the maximum number of entries. When full, the least recently used
+        entry is evicted. If `0`, nothing is cached.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_entries")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: typing.MutableMapping[tuple, typing.Any] = OrderedDict()
+
+    def get(self, key: tuple) -> typing.Any:
+        if not self.maxsize:
+            return _MISSING
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: tuple, value: typing.Any) -> None:
+        if not self.maxsize:
+            return
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._entries)
+        )
+
+
+class Router:
+    """A collection of routes.
+
+    # Parameters
+    matcher (str):
+        how routes are looked up, one of `"tree"` (segment tree), `"regex"`
+        (single combined regex) or `"linear"` (try each route in turn).
+        Defaults to the `ROUTE_MATCHER` setting, or `"tree"` if not set.
+    cache_size (int):
+        how many route lookup results should be kept in an LRU cache.
+        Pass `0` to disable caching.
+        Defaults to the `ROUTE_CACHE_SIZE` setting, or `1024` if not set.
+    """
+
+    __slots__ = (
+        "routes",
+        "lifespan",
+        "matcher",
+        "cache_size",
+        "_matchers",
+        "_cache",
+        "_url_formats",
+    )
+
+    def __init__(self, matcher: str = None, cache_size: int = None):
+        if matcher is not None and matcher not in MATCHERS:
+            raise ValueError(
+                f"Unknown route matcher: {matcher!r}. "
+                f"Available: {', '.join(MATCHERS)}"
+            )
         self.routes: typing.List[BaseRoute] = []
         self.lifespan = Lifespan()
+        self.matcher = matcher
+        self.cache_size = cache_size
+        self._matchers: typing.Optional[dict] = None
+        self._cache: typing.Optional[RouteCache] = None
+        self._url_formats: typing.Optional[typing.Dict[str, URLFormat]] = None
 
     def add_route(self, route: BaseRoute) -> None:
         self.routes.append(route)
+        self._matchers = None
+        self._url_formats = None
+        if self._cache is not None:
+            self._cache.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Return statistics about the route lookup cache.
+
+        # Returns
+        info (CacheInfo): a named tuple of `hits`, `misses`, `maxsize`
+        and `currsize`.
+        """
+        if self._cache is None:
+            return CacheInfo(0, 0, self.cache_size or 0, 0)
+        return self._cache.info()
+
+    def _build_matchers(self) -> dict:
+        # NOTE: HTTP and WebSocket routes are kept in separate tables so that
+        # they never need to be checked against the other scope type.
+        matcher = self.matcher or settings.get("ROUTE_MATCHER", "tree")
+        matcher_cls = MATCHERS[matcher]
+        return {
+            scope_type: matcher_cls(
+                route
+                for route in self.routes
+                if not isinstance(route, excluded)
+            )
+            for scope_type, excluded in (
+                ("http", WebSocketRoute),
+                ("websocket", HTTPRoute),
+            )
+        }
+
+    def _build_url_formats(self) -> typing.Dict[str, URLFormat]:
+        formats: typing.Dict[str, URLFormat] = {}
+
+        for route in self.routes:
+            if isinstance(route, Mount):
+                if route.name is not None:
+                    formats.setdefault(
+                        route.name, URLFormat.from_parser(route._parser)
+                    )
+
+                # Expose routes of mounted routers, prefixed by the mount's
+                # path (and the mount's name, if any).
+                router = getattr(route.app, "router", None)
+                if not isinstance(router, Router):
+                    continue
+                namespace = "" if route.name is None else route.name + ":"
+                for name, url_format in router.get_url_formats().items():
+                    formats.setdefault(
+                        namespace + name,
+                        url_format._replace(
+                            path_format=route.path + url_format.path_format
+                        ),
+                    )
+            elif isinstance(route, Patterned) and route.name is not None:
+                formats.setdefault(
+                    route.name, URLFormat.from_parser(route._parser)
+                )
+
+        return formats
+
+    def get_url_formats(self) -> typing.Dict[str, URLFormat]:
+        if self._url_formats is None:
+            self._url_formats = self._build_url_formats()
+        return self._url_formats
+
+    def url_for(self, name: str, **params: typing.Any) -> str:
+        """Build the URL path of a named route.
+
+        # Parameters
+        name (str):
+            the name of a route. Routes of a mounted app are available
+            under `"<mount name>:<route name>"` if the mount has a name.
+        **params (any): values for the route parameters.
+
+        # Returns
+        path (str): a URL path, e.g. `"/items/42"`.
+
+        # Raises
+        LookupError: if no route has the given name.
+        TypeError: if parameters are missing or unexpected.
+        """
+        try:
+            url_format = self.get_url_formats()[name]
+        except KeyError:
+            raise LookupError(f"No route named {name!r}") from None
+        return url_format.build(name, params)
 
     def include(self, other: "Router", prefix: str = ""):
         """Include the routes of another router."""
         for route in other.routes:
             assert isinstance(route, (HTTPRoute, WebSocketRoute, Mount))
             if prefix:
+                # NOTE: use the raw pattern so that converters are kept.
                 if isinstance(route, HTTPRoute):
                     route = HTTPRoute(
-                        pattern=_join(prefix, route.pattern), view=route.view
+                        pattern=_join(prefix, route._parser.source),
+                        view=route.view,
+                        name=route.name,
                     )
                 elif isinstance(route, WebSocketRoute):
                     route = WebSocketRoute(
-                        pattern=_join(prefix, route.pattern),
+                        pattern=_join(prefix, route._parser.source),
                         view=route.view,
+                        name=route.name,
                         **route.ws_kwargs,
                     )
                 else:
-                    route = Mount(path=_join(prefix, route.path), app=route.app)
+                    route = Mount(
+                        path=_join(prefix, route.path),
+                        app=route.app,
+                        name=route.name,
+                    )
             self.add_route(route)
 
-    def mount(self, path: str, app: ASGIApp):
-        """Mount an ASGI or WSGI app at the given path."""
-        return self.add_route(Mount(path, app))
+    def mount(self, path: str, app: ASGIApp, name: str = None):
+        """Mount an ASGI or WSGI app at the given path.
+
+        If a `name` is given, the mounted app's routes can be reversed
+        with `url_for("<name>:<route name>")`.
+        """
+        return self.add_route(Mount(path, app, name=name))
 
     def on(self, event: str, handler: typing.Optional[EventHandler] = None):
         if handler is None:
@@ -156,16 +644,23 @@ class Router:
         self.lifespan.add_event_handler(event, handler)
         return handler
 
-    def route(self, pattern: str, methods: typing.List[str] = None):
+    def route(
+        self, pattern: str, methods: typing.List[str] = None, name: str = None
+    ):
         """Register an HTTP route by decorating a view.
 
         # Parameters
         pattern (str): an URL pattern.
+        methods (list of str): the HTTP methods of a function-based view.
+        name (str):
+            a name used to build URLs with `url_for()`.
+            Defaults to the name of the view.
         """
 
         def decorate(view: typing.Any) -> HTTPRoute:
+            route_name = _get_view_name(view) if name is None else name
             view = View(view, methods=methods)
-            route = HTTPRoute(pattern, view)
+            route = HTTPRoute(pattern, view, name=route_name)
             self.add_route(route)
             return route
 
@@ -180,6 +675,7 @@ class Router:
         receive_type: str = None,
         send_type: str = None,
         caught_close_codes: typing.Tuple[int] = None,
+        name: str = None,
     ):
         """Register a WebSocket route by decorating a view.
 
@@ -188,13 +684,18 @@ class Router:
 
         # Parameters
         pattern (str): an URL pattern.
+        name (str):
+            a name used to build URLs with `url_for()`.
+            Defaults to the name of the view.
         """
 
         def decorate(view: typing.Any) -> WebSocketRoute:
+            route_name = _get_view_name(view) if name is None else name
             view = WebSocketView(view)
             route = WebSocketRoute(
                 pattern,
                 view,
+                name=route_name,
                 auto_accept=auto_accept,
                 value_type=value_type,
                 receive_type=receive_type,
@@ -207,12 +708,35 @@ class Router:
         return decorate
 
     def _find_route(self, scope: dict) -> typing.Optional[BaseRoute]:
-        for route in self.routes:
-            matches, child_scope = route.matches(scope)
-            if matches:
-                scope.update(child_scope)
-                return route
-        return None
+        if self._matchers is None:
+            self._matchers = self._build_matchers()
+        if self._cache is None:
+            cache_size = self.cache_size
+            if cache_size is None:
+                cache_size = settings.get("ROUTE_CACHE_SIZE", 1024)
+            self._cache = RouteCache(maxsize=cache_size)
+
+        # NOTE: the root path is part of the key because mounted apps
+        # derive their child scope from it.
+        key = (scope["type"], scope.get("root_path", ""), scope["path"])
+        found = self._cache.get(key)
+
+        if found is _MISSING:
+            matcher = self._matchers.get(scope["type"])
+            if matcher is None:
+                matcher = RouteList(self.routes)
+            found = matcher.find(scope)
+            self._cache.set(key, found)
+
+        if found is None:
+            return None
+
+        route, child_scope = found
+        scope.update(child_scope)
+        if "path_params" in child_scope:
+            # Don't let views alter the cached parameters.
+            scope["path_params"] = dict(child_scope["path_params"])
+        return route
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         scope["send"] = send  # See: `RequestResponseMiddleware`.
@@ -1,6 +1,7 @@
-from json import dumps
 import typing
 
+from .json_backends import dumps
+
 
 class server_event(str):
     """A string-like object that represents a [Server-Sent Event][sse].
@@ -29,8 +30,8 @@ class server_event(str):
         The event `data`. A sequence of strings can be given for
         multi-line event data.
     json (any):
-        A JSON-serializable value which, if given, is serialized and used as
-        `data`.
+        A JSON-serializable value which, if given, is serialized (see the
+        `JSON_BACKEND` setting) and used as `data`.
     id (int):
         An optional `id` for the event.
     """
@@ -1,14 +1,322 @@
+import mimetypes
+import os
+import typing
+from email.utils import formatdate
 from os.path import exists
 
 from whitenoise import WhiteNoise
 
+from .app_types import Receive, Scope, Send
 from .compat import WSGIApp, empty_wsgi_app
+from .conditional import is_not_modified
+from .files import ByteRanges, if_range_matches, parse_range, send_file
 
+# Precompressed variants, by order of preference.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
 
-def static(root: str, **kwargs) -> WSGIApp:
-    """Return a WSGI app that serves static files under the given directory.
+Headers = typing.List[typing.Tuple[bytes, bytes]]
 
-    Powered by [WhiteNoise](http://whitenoise.evans.io).
+
+class StaticFile(typing.NamedTuple):
+    """Information about a file, collected when building the index."""
+
+    path: str
+    size: int
+    mtime: int
+    etag: str
+    last_modified: str
+    headers: Headers
+    # Precompressed variants of this file, by content encoding.
+    variants: typing.Dict[str, "StaticFile"] = {}
+
+    @classmethod
+    def from_path(
+        cls, path: str, content_type: str = None, encoding: str = None
+    ) -> "StaticFile":
+        stat = os.stat(path)
+        mtime = int(stat.st_mtime)
+        etag = f'"{mtime:x}-{stat.st_size:x}"'
+        last_modified = formatdate(mtime, usegmt=True)
+
+        if content_type is None:
+            content_type, _ = mimetypes.guess_type(path)
+            content_type = content_type or "application/octet-stream"
+            if content_type.startswith("text/"):
+                content_type += "; charset=utf-8"
+
+        headers = [
+            (b"content-type", content_type.encode("latin-1")),
+            (b"content-length", str(stat.st_size).encode("latin-1")),
+            (b"last-modified", last_modified.encode("latin-1")),
+            (b"etag", etag.encode("latin-1")),
+        ]
+        if encoding is not None:
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+
+        return cls(
+            path=path,
+            size=stat.st_size,
+            mtime=mtime,
+            etag=etag,
+            last_modified=last_modified,
+            headers=headers,
+        )
+
+    def with_variants(self) -> "StaticFile":
+        content_type = dict(self.headers)[b"content-type"].decode("latin-1")
+        variants = {}
+        for encoding, suffix in ENCODINGS:
+            path = self.path + suffix
+            if os.path.isfile(path):
+                variants[encoding] = StaticFile.from_path(
+                    path, content_type=content_type, encoding=encoding
+                )
+        if not variants:
+            return self
+        return self._replace(variants=variants)
+
+
+def _accepted_encodings(accept_encoding: str) -> typing.Set[str]:
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        params = params.replace(" ", "")
+        if params in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class StaticFiles:
+    """An ASGI app that serves files under the given directory.
+
+    Files are indexed once, when the app is created, so that looking up
+    a file does not hit the file system.
+
+    Supported features:
+
+    - Precompressed `.br` and `.gz` files are served to clients that accept
+    them, based on the `Accept-Encoding` header.
+    - Conditional requests using `If-None-Match` and `If-Modified-Since`
+    receive a `304 Not Modified` response if the file has not changed.
+    - Partial requests using the `Range` and `If-Range` headers receive a
+    `206 Partial Content` response, which is a `multipart/byteranges` body
+    if several ranges were requested.
+
+    # Parameters
+    root (str):
+        the path to a directory from where static files should be served.
+        If the directory does not exist, no files will be served.
+    max_age (int):
+        the value of the `max-age` directive of the `Cache-Control` header,
+        in seconds. Pass `None` to not send a `Cache-Control` header.
+        Defaults to `60`.
+    autorefresh (bool):
+        if `True`, files are looked up on each request instead of using the
+        index. This allows serving files added after the app was created,
+        and is useful during development. Defaults to `False`.
+    chunk_size (int):
+        the size of the chunks the file is sent by, in bytes, if the server
+        does not support zero-copy send.
+        Defaults to the `FILE_CHUNK_SIZE` setting (64kB).
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_age: typing.Optional[int] = 60,
+        autorefresh: bool = False,
+        chunk_size: int = None,
+    ):
+        self.root = os.path.realpath(root)
+        self.max_age = max_age
+        self.autorefresh = autorefresh
+        self.chunk_size = chunk_size
+        self.index: typing.Dict[str, StaticFile] = {}
+        self._extra_headers: Headers = [
+            (b"accept-ranges", b"bytes"),
+            (b"vary", b"accept-encoding"),
+        ]
+        if max_age is not None:
+            self._extra_headers.append(
+                (b"cache-control", f"max-age={max_age}, public".encode())
+            )
+        if not autorefresh:
+            self.build_index()
+
+    def build_index(self):
+        """(Re)build the index of files under the `root` directory."""
+        index = {}
+        if os.path.isdir(self.root):
+            for directory, _, filenames in os.walk(self.root):
+                for filename in filenames:
+                    path = os.path.join(directory, filename)
+                    key = os.path.relpath(path, self.root)
+                    key = key.replace(os.path.sep, "/")
+                    index[key] = StaticFile.from_path(path).with_variants()
+        self.index = index
+
+    def find(self, path: str) -> typing.Optional[StaticFile]:
+        """Return the file corresponding to a URL path, if any."""
+        path = path.lstrip("/")
+        if not self.autorefresh:
+            return self.index.get(path)
+
+        full_path = os.path.realpath(os.path.join(self.root, path))
+        if not full_path.startswith(self.root + os.path.sep):
+            return None  # Outside of the root directory.
+        if not os.path.isfile(full_path):
+            return None
+        return StaticFile.from_path(full_path).with_variants()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        assert scope["type"] == "http"
+
+        if scope["method"] not in ("GET", "HEAD"):
+            await self._send_error(
+                send, 405, b"Method Not Allowed", [(b"allow", b"GET, HEAD")]
+            )
+            return
+
+        file = self.find(scope["path"])
+        if file is None:
+            await self._send_error(send, 404, b"Not Found")
+            return
+
+        headers = {}
+        for key, value in scope["headers"]:
+            headers[key.decode("latin-1")] = value.decode("latin-1")
+
+        ranges = None
+        if scope["method"] == "GET" and "range" in headers:
+            if "if-range" not in headers or if_range_matches(
+                headers["if-range"], file.etag, file.last_modified
+            ):
+                ranges = parse_range(headers["range"], file.size)
+
+        if file.variants and ranges is None:
+            accepted = _accepted_encodings(headers.get("accept-encoding", ""))
+            for encoding, _ in ENCODINGS:
+                if encoding in accepted and encoding in file.variants:
+                    file = file.variants[encoding]
+                    break
+
+        if is_not_modified(
+            headers.get("if-none-match"),
+            headers.get("if-modified-since"),
+            file.etag,
+            file.last_modified,
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (key, value)
+                        for key, value in file.headers
+                        if key in (b"etag", b"last-modified")
+                    ]
+                    + self._extra_headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if ranges == []:
+            await self._send_error(
+                send,
+                416,
+                b"Range Not Satisfiable",
+                [(b"content-range", f"bytes */{file.size}".encode())],
+            )
+            return
+
+        status = 200
+        response_headers = file.headers + self._extra_headers
+        byteranges: typing.Optional[ByteRanges] = None
+
+        if ranges:
+            status = 206
+            if len(ranges) == 1:
+                start, end = ranges[0]
+                partial_headers = [
+                    (b"content-length", str(end - start + 1).encode()),
+                    (
+                        b"content-range",
+                        f"bytes {start}-{end}/{file.size}".encode(),
+                    ),
+                ]
+            else:
+                content_type = dict(file.headers)[b"content-type"]
+                byteranges = ByteRanges(
+                    ranges, file.size, content_type.decode("latin-1")
+                )
+                partial_headers = [
+                    (b"content-type", byteranges.content_type.encode()),
+                    (
+                        b"content-length",
+                        str(byteranges.content_length).encode(),
+                    ),
+                ]
+            replaced = {key for key, _ in partial_headers}
+            response_headers = [
+                (key, value)
+                for key, value in response_headers
+                if key not in replaced
+            ] + partial_headers
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": response_headers,
+            }
+        )
+
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        with open(file.path, "rb") as f:
+            if byteranges is not None:
+                await byteranges.send(
+                    scope, send, f, chunk_size=self.chunk_size
+                )
+            elif ranges:
+                start, end = ranges[0]
+                await send_file(
+                    scope,
+                    send,
+                    f,
+                    offset=start,
+                    count=end - start + 1,
+                    chunk_size=self.chunk_size,
+                )
+            else:
+                await send_file(scope, send, f, chunk_size=self.chunk_size)
+
+    @staticmethod
+    async def _send_error(
+        send: Send, status: int, body: bytes, headers: Headers = None
+    ):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    *(headers or []),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def static(root: str, backend: str = "whitenoise", **kwargs) -> WSGIApp:
+    """Return an app that serves static files under the given directory.
+
+    By default, this is powered by [WhiteNoise](http://whitenoise.evans.io).
 
     [config-attrs]: http://whitenoise.evans.io/en/stable/base.html#configuration-attributes
 
@@ -16,12 +324,27 @@ def static(root: str, **kwargs) -> WSGIApp:
     root (str):
         the path to a directory from where static files should be served.
         If the directory does not exist, no files will be served.
+    backend (str):
+        which static files server to use:
+        - `"whitenoise"` (default): a WhiteNoise WSGI app.
+        - `"native"`: an ASGI app which does not need to run in a thread
+        pool. See #::bocadillo.staticfiles#StaticFiles.
     **kwargs (any):
-        keyword arguments passed to the WhiteNoise constructor. See also [Configuration attributes (WhiteNoise docs)][config-attrs].
+        keyword arguments passed to the WhiteNoise constructor (see also [Configuration attributes (WhiteNoise docs)][config-attrs]), or to `StaticFiles`.
 
     # Returns
-    app (callable): a WhiteNoise WSGI app.
+    app (callable): a WhiteNoise WSGI app, or a `StaticFiles` ASGI app.
+
+    # Raises
+    ValueError: if `backend` is not a known static files backend.
     """
+    if backend == "native":
+        return StaticFiles(root, **kwargs)
+    if backend != "whitenoise":
+        raise ValueError(
+            f"Unknown static files backend: {backend!r}. "
+            "Expected 'whitenoise' or 'native'."
+        )
     if exists(root):
         kwargs["root"] = root
     return WhiteNoise(empty_wsgi_app(), **kwargs)
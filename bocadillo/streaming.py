@@ -1,34 +1,224 @@
+import asyncio
 import typing
 import inspect
 
+from .json_backends import get_json_backend
 from .request import Request, ClientDisconnect
 
 Stream = typing.AsyncIterable[typing.AnyStr]
 StreamFunc = typing.Callable[[], Stream]
 
 
+class _Flush:
+    def __repr__(self) -> str:
+        return "FLUSH"
+
+
+# Yield this from a stream to send buffered chunks right away.
+FLUSH = _Flush()
+
+
+def watch_disconnect(req: Request) -> typing.Tuple[asyncio.Event, asyncio.Task]:
+    # Receive messages in the background until the client disconnects.
+    # This is much cheaper than polling `req.is_disconnected()`, which
+    # calls `receive()` with a timeout each time.
+    # NOTE: request body messages received by the watcher are discarded,
+    # so the request body must be read before the response is streamed.
+    disconnected = asyncio.Event()
+
+    async def watch():
+        while True:
+            message = await req.receive()
+            if message["type"] == "http.disconnect":
+                break
+        # Keep `req.is_disconnected()` consistent.
+        req._is_disconnected = True  # pylint: disable=protected-access
+        disconnected.set()
+
+    return disconnected, asyncio.ensure_future(watch())
+
+
 def stream_until_disconnect(
     req: Request, source: Stream, raise_on_disconnect: bool
 ) -> Stream:
     # Yield items from a stream until the client disconnects, then
     # throw an exception into the stream (if told to do so).
+    # If the client disconnects while the stream is waiting for the next
+    # item, the stream is cancelled right away, unless `raise_on_disconnect`
+    # is true (in which case the exception is thrown at the next `yield`).
 
     assert inspect.isasyncgen(source)
 
     async def stream():
-        async for item in source:
-            if not await req.is_disconnected():
-                yield item
-                continue
+        disconnected, watcher = watch_disconnect(req)
+        # Task currently waiting for the next item, if any.
+        blocked: typing.Optional[asyncio.Task] = None
+        cancelled = False
+
+        def on_disconnect(_):
+            nonlocal cancelled
+            if blocked is not None and not raise_on_disconnect:
+                cancelled = True
+                blocked.cancel()
 
-            if raise_on_disconnect:
+        watcher.add_done_callback(on_disconnect)
+
+        try:
+            while True:
+                blocked = asyncio.current_task()
                 try:
-                    await source.athrow(ClientDisconnect)
+                    item = await source.__anext__()
                 except StopAsyncIteration:
-                    # May be raised in Python 3.6 if the `source`'s error
-                    # handling code did not `yield` anything.
                     break
-            else:
-                break
+                except asyncio.CancelledError:
+                    if not cancelled:
+                        raise
+                    if hasattr(blocked, "uncancel"):
+                        blocked.uncancel()
+                    break
+                finally:
+                    blocked = None
+
+                if not disconnected.is_set():
+                    yield item
+                    continue
+
+                if raise_on_disconnect:
+                    try:
+                        await source.athrow(ClientDisconnect)
+                    except StopAsyncIteration:
+                        # May be raised in Python 3.6 if the `source`'s error
+                        # handling code did not `yield` anything.
+                        break
+                else:
+                    break
+        finally:
+            watcher.remove_done_callback(on_disconnect)
+            watcher.cancel()
+            await source.aclose()
+
+    return stream()
+
+
+async def _iterate(items: typing.Union[typing.Iterable, typing.AsyncIterable]):
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def json_stream(
+    items: typing.Union[typing.Iterable, typing.AsyncIterable],
+    ndjson: bool = False,
+    batch_size: int = 4096,
+) -> typing.AsyncGenerator[bytes, None]:
+    # Incrementally encode items into a JSON array, or into newline-delimited
+    # JSON. Small items are batched into chunks of at least `batch_size` bytes
+    # to reduce the number of ASGI messages sent.
+    # If `ClientDisconnect` is thrown in, the stream stops and the source
+    # is closed.
+    dumpb = get_json_backend().dumpb
+
+    async def stream():
+        source = _iterate(items)
+        buffer = bytearray() if ndjson else bytearray(b"[")
+        empty = True
+        try:
+            async for item in source:
+                if ndjson:
+                    buffer += dumpb(item)
+                    buffer += b"\n"
+                else:
+                    if not empty:
+                        buffer += b","
+                    buffer += dumpb(item)
+                empty = False
+                if len(buffer) >= batch_size:
+                    chunk = bytes(buffer)
+                    buffer.clear()
+                    yield chunk
+            if not ndjson:
+                buffer += b"]"
+            if buffer:
+                yield bytes(buffer)
+        except ClientDisconnect:
+            return
+        finally:
+            await source.aclose()
+            if hasattr(items, "aclose"):
+                await items.aclose()
+
+    return stream()
+
+
+def buffer_stream(
+    source: Stream, buffer_size: int, flush_interval: typing.Optional[float]
+) -> typing.AsyncGenerator[typing.AnyStr, None]:
+    # Coalesce chunks from a stream, so that fewer ASGI messages are sent.
+    # Buffered chunks are sent when there are at least `buffer_size` bytes,
+    # when the oldest one has been waiting for `flush_interval` seconds, or
+    # when `FLUSH` is yielded.
+
+    async def stream():
+        loop = asyncio.get_event_loop()
+        iterator = source.__aiter__()
+        buffer = bytearray()
+        deadline = 0.0
+        pending: typing.Optional[asyncio.Future] = None
+
+        try:
+            while True:
+                if buffer and flush_interval is not None:
+                    # Wait for the next item, but not past the deadline.
+                    if pending is None:
+                        pending = asyncio.ensure_future(iterator.__anext__())
+                    timeout = deadline - loop.time()
+                    if timeout > 0:
+                        await asyncio.wait({pending}, timeout=timeout)
+                    if not pending.done():
+                        chunk = bytes(buffer)
+                        buffer.clear()
+                        yield chunk
+                        continue
+
+                try:
+                    if pending is not None:
+                        item = await pending
+                    else:
+                        item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    pending = None
+
+                if item is FLUSH:
+                    if buffer:
+                        chunk = bytes(buffer)
+                        buffer.clear()
+                        yield chunk
+                    continue
+
+                if buffer_size <= 0:
+                    yield item
+                    continue
+
+                if not buffer and flush_interval is not None:
+                    deadline = loop.time() + flush_interval
+                buffer += (
+                    item.encode("utf-8") if isinstance(item, str) else item
+                )
+
+                if len(buffer) >= buffer_size:
+                    chunk = bytes(buffer)
+                    buffer.clear()
+                    yield chunk
+
+            if buffer:
+                yield bytes(buffer)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
 
     return stream()
@@ -1,24 +1,145 @@
 import re
 import typing
+import uuid
 
 PARAM_RE = re.compile(r"{}|{([a-zA-Z_:][a-zA-Z0-9_:]*)}")
 WILDCARD = "{}"
 
-CONVERTER_PATTERNS = {"path": r".*"}
 
+class RouteConverter:
+    """Base class for route parameter converters.
 
-def convert_part(name: str, converter: str) -> str:
+    A converter is referred to by name in URL patterns, e.g. `{pk:int}`.
+    Its `regex` is embedded in the compiled pattern, so paths that don't
+    match it never match the route. Matched values are then passed through
+    `convert()` before reaching the view.
+
+    ::: warning
+    Except for `path`, converters must only match within a single path
+    segment, i.e. `regex` must not match slashes. Besides, `convert()` must
+    succeed for any value matched by `regex`.
+    :::
+
+    # Attributes
+    regex (str): a regular expression that raw values must match.
+    """
+
+    regex = r"[^/]+"
+
+    def convert(self, value: str) -> typing.Any:
+        """Convert a raw value matched by `regex`."""
+        return value
+
+    def to_string(self, value: typing.Any) -> str:
+        """Convert a value back to its URL representation."""
+        return str(value)
+
+
+class PathConverter(RouteConverter):
+    regex = r".*"
+
+
+class IntConverter(RouteConverter):
+    regex = r"[0-9]+"
+
+    def convert(self, value: str) -> int:
+        return int(value)
+
+    def to_string(self, value: typing.Any) -> str:
+        value = int(value)
+        assert value >= 0, "Negative integers are not supported"
+        return str(value)
+
+
+class UUIDConverter(RouteConverter):
+    regex = (
+        r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
+        r"[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    )
+
+    def convert(self, value: str) -> uuid.UUID:
+        return uuid.UUID(value)
+
+
+class SlugConverter(RouteConverter):
+    regex = r"[-a-zA-Z0-9_]+"
+
+
+CONVERTERS: typing.Dict[str, RouteConverter] = {
+    "path": PathConverter(),
+    "int": IntConverter(),
+    "uuid": UUIDConverter(),
+    "slug": SlugConverter(),
+}
+
+
+def register_converter(name: str, converter: RouteConverter) -> None:
+    """Register a route parameter converter.
+
+    Only routes declared afterwards can use the converter.
+
+    # Example
+
+    ```python
+    from bocadillo.urlparse import RouteConverter, register_converter
+
+    class HexConverter(RouteConverter):
+        regex = r"[0-9a-f]+"
+
+        def convert(self, value: str) -> int:
+            return int(value, 16)
+
+        def to_string(self, value: int) -> str:
+            return format(value, "x")
+
+    register_converter("hex", HexConverter())
+
+    @app.route("/colors/{code:hex}")
+    async def get_color(req, res, code: int):
+        pass
+    ```
+
+    # Parameters
+    name (str): the name of the converter, as used in URL patterns.
+    converter (RouteConverter): a converter instance.
+    """
+    CONVERTERS[name] = converter
+
+
+# Path segments which only contain these characters are matched literally
+# by the regex produced by `compile_path()`.
+LITERAL_RE = re.compile(r"[\w\-~%@!&',;=:]*")
+
+STATIC = "static"
+PARAM = "param"
+CATCHALL = "catchall"
+COMPLEX = "complex"
+
+
+class Segment(typing.NamedTuple):
+    kind: str
+    value: typing.Optional[str] = None
+    converter: typing.Optional[str] = None
+
+
+def get_converter(name: str, converter: str) -> RouteConverter:
     try:
-        return CONVERTER_PATTERNS[converter]
+        return CONVERTERS[converter]
     except KeyError as exc:
         raise TypeError(
             f"Unknown path converter '{converter}' "
             f"on route parameter '{name}'. "
-            f"Available: {', '.join(CONVERTER_PATTERNS)}"
+            f"Available: {', '.join(CONVERTERS)}"
         ) from exc
 
 
-def compile_path(pattern: str) -> typing.Tuple[typing.Pattern, str]:
+def convert_part(name: str, converter: str) -> str:
+    return get_converter(name, converter).regex
+
+
+def compile_path(
+    pattern: str, group_prefix: str = ""
+) -> typing.Tuple[typing.Pattern, str]:
     regex = "^"
     path_format = ""
     idx = 0
@@ -33,7 +154,7 @@ def compile_path(pattern: str) -> typing.Tuple[typing.Pattern, str]:
             expr = r".*"
         else:
             part = convert_part(name, converter) if has_converter else r"[^/]+"
-            expr = rf"?P<{name}>{part}"
+            expr = rf"?P<{group_prefix}{name}>{part}"
         regex += rf"({expr})"
 
         path_format += pattern[idx : match.start()]
@@ -47,14 +168,67 @@ def compile_path(pattern: str) -> typing.Tuple[typing.Pattern, str]:
     return re.compile(regex), path_format
 
 
+def split_segments(pattern: str) -> typing.List[Segment]:
+    # Decompose a pattern into typed segments that can be matched against
+    # the `/`-separated parts of a path.
+    # Segments that cannot be matched part by part (e.g. because they
+    # contain regex metacharacters, anonymous wildcards or path converters
+    # followed by other segments) are reported as `COMPLEX`, and all
+    # segments after them are dropped.
+    if not pattern.startswith("/"):
+        return [Segment(COMPLEX)]
+
+    parts = pattern.split("/")
+    segments: typing.List[Segment] = []
+
+    for position, part in enumerate(parts):
+        is_last = position == len(parts) - 1
+        match = PARAM_RE.fullmatch(part)
+
+        if match is None:
+            if PARAM_RE.search(part) or not LITERAL_RE.fullmatch(part):
+                segments.append(Segment(COMPLEX))
+                break
+            segments.append(Segment(STATIC, part))
+            continue
+
+        declaration, = match.groups(default="")
+        name, sep, converter = declaration.partition(":")
+
+        if name and not sep:
+            segments.append(Segment(PARAM, name))
+        elif name and converter != "path":
+            segments.append(Segment(PARAM, name, converter))
+        elif is_last and (not declaration or converter == "path"):
+            segments.append(Segment(CATCHALL, name or None))
+        else:
+            segments.append(Segment(COMPLEX))
+            break
+
+    return segments
+
+
 class Parser:
     def __init__(self, pattern: str):
         if pattern != WILDCARD and not pattern.startswith("/"):
             pattern = f"/{pattern}"
+        self.source = pattern
         self.regex, self.pattern = compile_path(pattern)
+        self.segments = split_segments(pattern)
+        self.converters: typing.Dict[str, RouteConverter] = {}
+        for match in PARAM_RE.finditer(pattern):
+            declaration, = match.groups(default="")
+            name, sep, converter = declaration.partition(":")
+            if name and sep:
+                self.converters[name] = get_converter(name, converter)
+
+    def convert(self, params: dict) -> dict:
+        for name, converter in self.converters.items():
+            params[name] = converter.convert(params[name])
+        return params
 
     def parse(self, value: str) -> typing.Optional[dict]:
         match = self.regex.match(value)
         if match is None:
             return None
-        return match.groupdict()
+        return self.convert(match.groupdict())
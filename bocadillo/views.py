@@ -1,5 +1,6 @@
 import inspect
 import typing
+from types import MappingProxyType
 
 from . import injection
 from .app_types import Handler
@@ -56,6 +57,16 @@ class View:
     ::: tip
     `.handle()` is special: if defined, it overrides all others.
     :::
+
+    Handlers are looked up in a method dispatch table built when the view
+    is created. If no handler exists for the requested method, a
+    `405 Method Not Allowed` response with an `Allow` header is returned,
+    except for `OPTIONS` requests which automatically get a bodiless
+    response with the `Allow` header.
+
+    # Attributes
+    handlers (mapping):
+        a read-only mapping of upper-cased HTTP methods to handlers.
     """
 
     __slots__ = (
@@ -67,6 +78,9 @@ class View:
         "head",
         "options",
         "handle",
+        "handlers",
+        "_fallback",
+        "_allow",
     )
 
     get: Handler
@@ -77,6 +91,7 @@ class View:
     head: Handler
     options: Handler
     handle: Handler
+    handlers: typing.Mapping[str, Handler]
 
     def __init__(self, obj: typing.Any, methods: typing.List[str] = None):
         if isinstance(obj, View):
@@ -117,13 +132,25 @@ class View:
             handler = convert_arguments(handler, converter_class=HTTPConverter)
             handler = injection.consumer(handler)
             setattr(self, method, handler)
+            handlers[method] = handler
+
+        # `.handle()` also receives requests made with non-standard methods.
+        self._fallback: typing.Optional[Handler] = handlers.pop("handle", None)
+        if self._fallback is not None:
+            handlers = {method: self._fallback for method in ALL_HTTP_METHODS}
+
+        self.handlers = MappingProxyType(
+            {method.upper(): handler for method, handler in handlers.items()}
+        )
+        self._allow = ", ".join(sorted({*self.handlers, "OPTIONS"}))
 
     async def __call__(self, req, res, **params):
-        try:
-            handler = getattr(self, "handle")
-        except AttributeError:
-            try:
-                handler = getattr(self, req.method.lower())
-            except AttributeError:
-                raise HTTPError(405)
+        handler = self.handlers.get(req.method, self._fallback)
+
+        if handler is None:
+            res.headers["allow"] = self._allow
+            if req.method == "OPTIONS":
+                return
+            raise HTTPError(405)
+
         await handler(req, res, **params)
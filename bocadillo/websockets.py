@@ -11,6 +11,7 @@ from .compat import asyncnullcontext, check_async
 from .constants import WEBSOCKET_CLOSE_CODES
 from .converters import ViewConverter, convert_arguments
 from .injection import consumer
+from .json_backends import dumps, loads
 
 
 class WebSocket:
@@ -161,18 +162,24 @@ class WebSocket:
     async def receive_json(self) -> typing.Union[dict, list]:
         """Receive a message as text and parse it to a JSON object.
 
+        The message is decoded using the JSON backend selected by the
+        `JSON_BACKEND` setting.
+
         # Raises
-        json.JSONDecodeError: if the received JSON is invalid.
+        ValueError: if the received JSON is invalid.
         """
-        return await self._ws.receive_json()
+        return loads(await self._ws.receive_text())
 
     async def send_json(self, data: typing.Union[dict, list]):
         """Serialize an object to JSON and send it as text.
 
+        The object is encoded using the JSON backend selected by the
+        `JSON_BACKEND` setting.
+
         # Raises
         TypeError: if the given `data` is not JSON serializable.
         """
-        return await self._ws.send_json(data)
+        return await self._ws.send_text(dumps(data))
 
     async def receive_event(self) -> Event:
         """Receive a raw ASGI event."""
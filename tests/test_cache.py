@@ -0,0 +1,216 @@
+import time
+
+import pytest
+
+from bocadillo import App, configure, create_client
+from bocadillo.cache import CacheBackend, CacheMiddleware, MemoryBackend, cache
+
+
+class FakeRedis:
+    # An in-process stand-in for a Redis client.
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        value, expires_at = self.data.get(key, (None, 0))
+        if expires_at <= time.monotonic():
+            return None
+        return value
+
+    async def set(self, key, value, expire):
+        assert isinstance(value, bytes)
+        self.data[key] = (value, time.monotonic() + expire)
+
+
+class RedisBackend(CacheBackend):
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+
+    async def get(self, key):
+        return await self.redis.get(key)
+
+    async def set(self, key, value, ttl):
+        await self.redis.set(key, value, expire=ttl)
+
+
+@pytest.fixture(name="calls")
+def fixture_calls():
+    return []
+
+
+@pytest.fixture(name="cached_app")
+def fixture_cached_app(app: App, calls: list) -> App:
+    app.add_middleware(CacheMiddleware)
+
+    @app.route("/")
+    @cache(60)
+    async def index(req, res):
+        calls.append(req.url.path)
+        res.json = {"calls": len(calls)}
+
+    @app.route("/uncached")
+    async def uncached(req, res):
+        calls.append(req.url.path)
+        res.json = {"calls": len(calls)}
+
+    return app
+
+
+def test_cached_response_skips_view(cached_app: App, client, calls: list):
+    r = client.get("/")
+    assert r.json() == {"calls": 1}
+    assert r.headers["cache-control"] == "s-maxage=60"
+
+    r = client.get("/")
+    assert r.status_code == 200
+    assert r.json() == {"calls": 1}
+    assert r.headers["content-type"] == "application/json"
+    assert r.headers["cache-control"] == "s-maxage=60"
+    assert calls == ["/"]
+
+
+def test_only_views_with_ttl_are_cached(cached_app: App, client, calls: list):
+    client.get("/uncached")
+    client.get("/uncached")
+    assert calls == ["/uncached", "/uncached"]
+
+
+def test_default_ttl(app: App, client, calls: list):
+    app.add_middleware(CacheMiddleware, ttl=60)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.url.path)
+
+    @app.route("/private")
+    async def private(req, res):
+        calls.append(req.url.path)
+        res.headers["cache-control"] = "private"
+
+    for _ in range(2):
+        client.get("/")
+        client.get("/private")
+
+    assert calls == ["/", "/private", "/private"]
+
+
+def test_query_string_is_part_of_key(cached_app: App, client, calls: list):
+    client.get("/?page=1")
+    client.get("/?page=2")
+    client.get("/?page=1")
+    assert len(calls) == 2
+
+
+def test_unsafe_methods_are_not_cached(app: App, client, calls: list):
+    app.add_middleware(CacheMiddleware, ttl=60)
+
+    @app.route("/", methods=["post"])
+    async def index(req, res):
+        calls.append(req.url.path)
+
+    client.post("/")
+    client.post("/")
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("status_code", [201, 404])
+def test_only_successful_responses_are_cached(
+    app: App, client, calls: list, status_code: int
+):
+    app.add_middleware(CacheMiddleware, ttl=60)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.url.path)
+        res.status_code = status_code
+
+    client.get("/")
+    client.get("/")
+    assert len(calls) == 2
+
+
+def test_vary(app: App, client, calls: list):
+    app.add_middleware(CacheMiddleware, ttl=60)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.url.path)
+        res.headers["vary"] = "Accept-Language"
+        res.text = req.headers.get("accept-language", "")
+
+    assert client.get("/", headers={"accept-language": "fr"}).text == "fr"
+    assert client.get("/", headers={"accept-language": "en"}).text == "en"
+    assert client.get("/", headers={"accept-language": "fr"}).text == "fr"
+    assert len(calls) == 2
+
+
+def test_streaming_responses_are_not_cached(app: App, client, calls: list):
+    app.add_middleware(CacheMiddleware, ttl=60)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.url.path)
+
+        @res.stream
+        async def stream():
+            yield "foo"
+
+    assert client.get("/").text == "foo"
+    assert client.get("/").text == "foo"
+    assert len(calls) == 2
+
+
+def test_custom_backend(app: App, client, calls: list):
+    redis = FakeRedis()
+    app.add_middleware(CacheMiddleware, backend=RedisBackend(redis), ttl=60)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.url.path)
+        res.text = "Hello"
+
+    assert client.get("/").text == "Hello"
+    assert client.get("/").text == "Hello"
+    assert len(calls) == 1
+    assert redis.data
+
+
+def test_response_cache_setting(raw_app: App, calls: list):
+    app = configure(raw_app, response_cache={"ttl": 60})
+    client = create_client(app)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.url.path)
+
+    client.get("/")
+    client.get("/")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_expires_values():
+    backend = MemoryBackend()
+    await backend.set("foo", b"bar", ttl=60)
+    assert await backend.get("foo") == b"bar"
+    await backend.set("foo", b"bar", ttl=0)
+    assert await backend.get("foo") is None
+    assert backend.size == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(max_size=10)
+    await backend.set("a", b"1234", ttl=60)
+    await backend.set("b", b"1234", ttl=60)
+    await backend.get("a")
+    await backend.set("c", b"1234", ttl=60)
+
+    assert await backend.get("a") == b"1234"
+    assert await backend.get("b") is None
+    assert await backend.get("c") == b"1234"
+    assert backend.size == 10
+
+    await backend.set("d", b"too large for the cache", ttl=60)
+    assert await backend.get("d") is None
@@ -1,9 +1,13 @@
 import typing
+import uuid
 
 import pytest
 import typesystem
 
 from bocadillo import create_client
+from bocadillo.converters import Converter, convert_arguments
+from bocadillo.urlparse import CONVERTERS, RouteConverter, register_converter
+from bocadillo.views import HTTPConverter
 
 
 def setup_http(app, annotation):
@@ -150,3 +154,83 @@ def test_querystring_converter(
     )
     json = get_json(client, f"/{querystring}")
     assert json == result
+
+
+def test_view_without_conversions_is_not_wrapped():
+    async def index(req, res, pk):
+        pass
+
+    assert convert_arguments(index, converter_class=HTTPConverter) is index
+
+
+@pytest.mark.asyncio
+async def test_positional_arguments_are_converted():
+    async def add(x: int, y: int, z: int = "not validated"):
+        return x, y, z
+
+    converted = convert_arguments(add, converter_class=Converter)
+    assert await converted("1", y="2") == (1, 2, "not validated")
+    assert await converted("1", "2", "3") == (1, 2, 3)
+
+
+@pytest.mark.parametrize(
+    "pattern, path, value",
+    [
+        ("/{value:int}", "/42", 42),
+        ("/{value:int}", "/4.2", None),
+        ("/{value:int}", "/a1", None),
+        (
+            "/{value:uuid}",
+            "/12345678-1234-5678-1234-567812345678",
+            "12345678-1234-5678-1234-567812345678",
+        ),
+        ("/{value:uuid}", "/foo", None),
+        ("/{value:slug}", "/hello-world_2", "hello-world_2"),
+        ("/{value:slug}", "/hello.world", None),
+    ],
+)
+def test_route_converters(app, client, pattern, path, value):
+    @app.route(pattern)
+    async def index(req, res, value):
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        res.json = {"value": value}
+
+    r = client.get(path)
+    if value is None:
+        assert r.status_code == 404
+    else:
+        assert r.json() == {"value": value}
+
+
+def test_route_converters_fall_through_to_next_route(app, client):
+    @app.route("/items/{pk:int}")
+    async def get_item(req, res, pk):
+        res.json = {"pk": pk}
+
+    @app.route("/items/{slug}")
+    async def get_item_by_slug(req, res, slug):
+        res.json = {"slug": slug}
+
+    assert client.get("/items/1").json() == {"pk": 1}
+    assert client.get("/items/foo").json() == {"slug": "foo"}
+
+
+def test_register_converter(app, client):
+    class HexConverter(RouteConverter):
+        regex = r"[0-9a-f]+"
+
+        def convert(self, value: str) -> int:
+            return int(value, 16)
+
+    register_converter("hex", HexConverter())
+    try:
+
+        @app.route("/colors/{code:hex}")
+        async def get_color(req, res, code):
+            res.json = {"code": code}
+
+        assert client.get("/colors/ff").json() == {"code": 255}
+        assert client.get("/colors/zz").status_code == 404
+    finally:
+        del CONVERTERS["hex"]
@@ -0,0 +1,130 @@
+import pytest
+
+from bocadillo import App, configure, create_client
+from bocadillo.conditional import etag_matches, is_not_modified, make_etag
+
+
+def test_no_etag_by_default(app: App, client):
+    @app.route("/")
+    async def index(req, res):
+        res.text = "Hello"
+
+    assert "etag" not in client.get("/").headers
+
+
+@pytest.mark.parametrize(
+    "etag, weak", [(True, False), ("strong", False), ("weak", True)]
+)
+def test_etag(app: App, client, etag, weak: bool):
+    @app.route("/")
+    async def index(req, res):
+        res.etag = etag
+        res.text = "Hello"
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["etag"] == make_etag(b"Hello", weak=weak)
+    assert response.headers["etag"].startswith("W/") is weak
+
+
+def test_etag_setting(raw_app: App):
+    app = configure(raw_app, etag=True)
+    client = create_client(app)
+
+    @app.route("/")
+    async def index(req, res):
+        res.json = {"message": "Hello"}
+
+    @app.route("/disabled")
+    async def disabled(req, res):
+        res.etag = False
+        res.json = {"message": "Hello"}
+
+    assert "etag" in client.get("/").headers
+    assert "etag" not in client.get("/disabled").headers
+
+
+def test_not_modified(app: App, client):
+    called = False
+
+    @app.route("/")
+    async def index(req, res):
+        res.etag = True
+        res.json = {"message": "Hello"}
+
+        @res.background
+        async def task():
+            nonlocal called
+            called = True
+
+    etag = client.get("/").headers["etag"]
+    called = False
+
+    response = client.get("/", headers={"if-none-match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert "content-type" not in response.headers
+    assert called
+
+    response = client.get("/", headers={"if-none-match": '"other"'})
+    assert response.status_code == 200
+    assert response.json() == {"message": "Hello"}
+
+
+def test_if_modified_since(app: App, client):
+    last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    @app.route("/")
+    async def index(req, res):
+        res.etag = True
+        res.headers["last-modified"] = last_modified
+        res.text = "Hello"
+
+    headers = {"if-modified-since": last_modified}
+    assert client.get("/", headers=headers).status_code == 304
+
+    headers = {"if-modified-since": "Tue, 20 Oct 2015 07:28:00 GMT"}
+    assert client.get("/", headers=headers).status_code == 200
+
+
+def test_only_successful_get_requests_are_conditional(app: App, client):
+    @app.route("/")
+    class Index:
+        async def get(self, req, res):
+            res.etag = True
+            res.status_code = 201
+            res.text = "Hello"
+
+        async def post(self, req, res):
+            res.etag = True
+            res.text = "Hello"
+
+    etag = make_etag(b"Hello")
+    headers = {"if-none-match": etag}
+    assert client.get("/", headers=headers).status_code == 201
+    assert client.post("/", headers=headers).status_code == 200
+
+
+@pytest.mark.parametrize(
+    "if_none_match, etag, expected",
+    [
+        ('"a"', '"a"', True),
+        ('"a"', 'W/"a"', True),
+        ('W/"a"', '"a"', True),
+        ('"b", "a"', '"a"', True),
+        ("*", '"a"', True),
+        ('"b"', '"a"', False),
+    ],
+)
+def test_etag_matches(if_none_match: str, etag: str, expected: bool):
+    assert etag_matches(if_none_match, etag) is expected
+
+
+def test_if_none_match_takes_precedence():
+    assert not is_not_modified(
+        '"b"',
+        "Wed, 21 Oct 2015 07:28:00 GMT",
+        '"a"',
+        "Wed, 21 Oct 2015 07:28:00 GMT",
+    )
@@ -2,7 +2,8 @@ from pathlib import Path
 
 import pytest
 
-from bocadillo import App
+from bocadillo import App, configure, create_client
+from bocadillo.files import ZEROCOPY, FileResponse
 
 
 @pytest.fixture(name="txt")
@@ -42,3 +43,164 @@ def test_if_file_does_not_exist_then_fail(app: App, client):
         client.get("/")
 
     assert "does not exist" in str(ctx.value)
+
+
+def test_content_type_is_guessed_from_path(app: App, client, tmp_path):
+    css = tmp_path / "styles.css"
+    css.write_text("h1 { color: red; }")
+
+    @app.route("/")
+    async def index(req, res):
+        res.file(str(css), attach=False)
+
+    response = client.get("/")
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["content-length"] == str(len(css.read_text()))
+
+
+def test_head_does_not_send_file(app: App, client, txt: Path):
+    @app.route("/")
+    async def index(req, res):
+        res.file(str(txt))
+
+    response = client.head("/")
+    assert response.status_code == 200
+    assert response.headers["content-length"] == str(len(txt.read_text()))
+    assert response.text == ""
+
+
+def test_empty_file(app: App, client, tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+
+    @app.route("/")
+    async def index(req, res):
+        res.file(str(empty))
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+def test_file_chunk_size(raw_app, txt: Path):
+    app = configure(raw_app, file_chunk_size=3)
+    client = create_client(app)
+
+    @app.route("/")
+    async def index(req, res):
+        res.file(str(txt))
+
+    assert client.get("/").text == txt.read_text()
+
+
+@pytest.mark.asyncio
+async def test_zerocopy_send(txt: Path):
+    messages = []
+
+    async def send(message):
+        if message["type"] == ZEROCOPY:
+            message["file"].seek(message["offset"])
+            message = {
+                **message,
+                "body": message["file"].read(message["count"]),
+            }
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "extensions": {ZEROCOPY: {}}}
+    await FileResponse(str(txt))(scope, None, send)
+
+    start, body = messages
+    assert start["type"] == "http.response.start"
+    assert body["type"] == ZEROCOPY
+    assert body["body"] == txt.read_bytes()
+
+
+@pytest.fixture(name="digits")
+def fixture_digits(app: App, tmp_path) -> str:
+    path = tmp_path / "digits.txt"
+    path.write_text("0123456789")
+
+    @app.route("/digits")
+    async def digits(req, res):
+        res.file(str(path), attach=False)
+
+    return path.read_text()
+
+
+def test_accept_ranges(client, digits: str):
+    response = client.get("/digits")
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.text == digits
+
+
+@pytest.mark.parametrize(
+    "value, content_range, body",
+    [
+        ("bytes=2-4", "bytes 2-4/10", "234"),
+        ("bytes=7-", "bytes 7-9/10", "789"),
+        ("bytes=-2", "bytes 8-9/10", "89"),
+        ("bytes=8-100", "bytes 8-9/10", "89"),
+        ("bytes=20-30, 1-1", "bytes 1-1/10", "1"),
+    ],
+)
+def test_range(client, digits: str, value, content_range, body):
+    response = client.get("/digits", headers={"range": value})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == content_range
+    assert response.headers["content-length"] == str(len(body))
+    assert response.text == body
+
+
+def test_multiple_ranges(client, digits: str):
+    response = client.get("/digits", headers={"range": "bytes=0-1,5-6"})
+    assert response.status_code == 206
+
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=")[1]
+    assert response.headers["content-length"] == str(len(response.content))
+
+    parts = response.text.split(f"--{boundary}")
+    assert parts[0] == ""
+    assert parts[-1] == "--\r\n"
+    assert parts[1:-1] == [
+        (
+            "\r\ncontent-type: text/plain; charset=utf-8\r\n"
+            f"content-range: bytes {start}-{end}/10\r\n\r\n"
+            f"{digits[start : end + 1]}\r\n"
+        )
+        for start, end in [(0, 1), (5, 6)]
+    ]
+
+
+@pytest.mark.parametrize("value", ["bytes=10-", "bytes=-0", "bytes=20-30,40-"])
+def test_range_not_satisfiable(client, digits: str, value: str):
+    response = client.get("/digits", headers={"range": value})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */10"
+    assert response.text == ""
+
+
+@pytest.mark.parametrize("value", ["items=0-1", "bytes=4-2", "bytes=a-b"])
+def test_invalid_range_is_ignored(client, digits: str, value: str):
+    response = client.get("/digits", headers={"range": value})
+    assert response.status_code == 200
+    assert response.text == digits
+
+
+@pytest.mark.parametrize("validator", ["etag", "last-modified"])
+def test_if_range(client, digits: str, validator: str):
+    value = client.get("/digits").headers[validator]
+
+    response = client.get(
+        "/digits", headers={"range": "bytes=0-1", "if-range": value}
+    )
+    assert response.status_code == 206
+    assert response.text == "01"
+
+    response = client.get(
+        "/digits", headers={"range": "bytes=0-1", "if-range": '"other"'}
+    )
+    assert response.status_code == 200
+    assert response.text == digits
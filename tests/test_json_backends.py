@@ -0,0 +1,131 @@
+import pytest
+
+from bocadillo import App, configure, create_client, server_event, settings
+from bocadillo.json_backends import (
+    JSONBackend,
+    OrjsonBackend,
+    StdlibJSONBackend,
+    get_json_backend,
+)
+
+
+def _installed(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+@pytest.fixture(
+    params=[
+        "json",
+        "auto",
+        pytest.param(
+            "orjson",
+            marks=pytest.mark.skipif(
+                not _installed("orjson"), reason="orjson not installed"
+            ),
+        ),
+        pytest.param(
+            "ujson",
+            marks=pytest.mark.skipif(
+                not _installed("ujson"), reason="ujson not installed"
+            ),
+        ),
+    ]
+)
+def app(raw_app: App, request) -> App:
+    return configure(raw_app, json_backend=request.param)
+
+
+def test_default_backend_is_stdlib(raw_app: App):
+    configure(raw_app)
+    assert isinstance(get_json_backend(), StdlibJSONBackend)
+
+
+def test_backend_is_selected_by_setting(app: App):
+    expected = settings.JSON_BACKEND
+    if expected == "auto":
+        expected = next(
+            name for name in ("orjson", "ujson", "json") if _installed(name)
+        )
+    assert get_json_backend().name == expected
+
+
+def test_response_json(app: App, client):
+    @app.route("/")
+    async def index(req, res):
+        res.json = {"message": "héllo", "items": [1, 2.5, None, True]}
+
+    response = client.get("/")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "message": "héllo",
+        "items": [1, 2.5, None, True],
+    }
+
+
+def test_request_json(app: App, client):
+    @app.route("/", methods=["post"])
+    async def index(req, res):
+        res.json = {"received": await req.json(), "again": await req.json()}
+
+    response = client.post("/", json={"message": "hi"})
+    assert response.json() == {
+        "received": {"message": "hi"},
+        "again": {"message": "hi"},
+    }
+
+
+def test_malformed_request_json(app: App, client):
+    @app.route("/", methods=["post"])
+    async def index(req, res):
+        await req.json()
+
+    assert client.post("/", data="{").status_code == 400
+
+
+def test_server_event_json(app: App):
+    event = server_event(json={"message": "hi"})
+    data = event.split("data: ", 1)[1].strip()
+    assert get_json_backend().loads(data) == {"message": "hi"}
+
+
+def test_websocket_json(app: App, client):
+    @app.websocket_route("/echo")
+    async def echo(ws):
+        await ws.send_json({"echo": await ws.receive_json()})
+
+    with client.websocket_connect("/echo") as ws:
+        ws.send_json({"message": "hi"})
+        assert ws.receive_json() == {"echo": {"message": "hi"}}
+
+
+def test_unknown_backend(raw_app: App):
+    configure(raw_app, json_backend="unknown")
+    with pytest.raises(ValueError):
+        get_json_backend()
+
+
+def test_custom_backend(raw_app: App):
+    class UpperBackend(JSONBackend):
+        def dumps(self, value):
+            return StdlibJSONBackend().dumps(value).upper()
+
+        def loads(self, data):
+            return StdlibJSONBackend().loads(data)
+
+    app = configure(raw_app, json_backend=UpperBackend())
+    client = create_client(app)
+
+    @app.route("/")
+    async def index(req, res):
+        res.json = {"message": "hi"}
+
+    assert client.get("/").text == '{"MESSAGE": "HI"}'
+
+
+@pytest.mark.skipif(not _installed("orjson"), reason="orjson not installed")
+def test_orjson_produces_bytes():
+    assert OrjsonBackend().dumpb({"a": 1}) == b'{"a":1}'
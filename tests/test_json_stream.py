@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from bocadillo import App, ClientDisconnect
+from bocadillo.streaming import json_stream
+
+
+async def numbers(n: int):
+    for i in range(n):
+        yield {"value": i}
+
+
+@pytest.mark.parametrize("n", [0, 1, 3, 1000])
+def test_json_stream(app: App, client, n: int):
+    @app.route("/")
+    async def index(req, res):
+        res.json_stream(numbers(n))
+
+    r = client.get("/")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.json() == [{"value": i} for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [0, 1, 3, 1000])
+def test_ndjson(app: App, client, n: int):
+    @app.route("/")
+    async def index(req, res):
+        res.ndjson(numbers(n))
+
+    r = client.get("/")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    lines = r.text.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"value": i} for i in range(n)
+    ]
+
+
+def test_json_stream_accepts_sync_iterables(app: App, client):
+    @app.route("/")
+    async def index(req, res):
+        res.json_stream(range(3))
+
+    assert client.get("/").json() == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ndjson", [False, True])
+async def test_small_items_are_batched(ndjson: bool):
+    chunks = [
+        chunk
+        async for chunk in json_stream(
+            range(1000), ndjson=ndjson, batch_size=100
+        )
+    ]
+    assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+    assert len(chunks) < 100
+
+
+@pytest.mark.asyncio
+async def test_source_is_closed_on_client_disconnect():
+    closed = False
+
+    async def source():
+        nonlocal closed
+        try:
+            while True:
+                yield "x" * 10
+        finally:
+            closed = True
+
+    stream = json_stream(source(), batch_size=1)
+    assert await stream.__anext__() == b'["xxxxxxxxxx"'
+
+    with pytest.raises(StopAsyncIteration):
+        await stream.athrow(ClientDisconnect)
+
+    assert closed
@@ -17,9 +17,7 @@ def test_allowed_methods(app: App, client, methods, method, status):
     assert response.status_code == status
 
 
-@pytest.mark.parametrize(
-    "method", ["post", "delete", "put", "patch", "options"]
-)
+@pytest.mark.parametrize("method", ["post", "delete", "put", "patch"])
 def test_unsafe_methods_not_supported_by_default(app: App, client, method):
     @app.route("/")
     async def index(req, res):
@@ -27,6 +25,37 @@ def test_unsafe_methods_not_supported_by_default(app: App, client, method):
 
     response = getattr(client, method)("/")
     assert response.status_code == 405
+    assert response.headers["allow"] == "GET, HEAD, OPTIONS"
+
+
+def test_options_is_answered_automatically(app: App, client):
+    called = False
+
+    @app.route("/")
+    class Index:
+        async def get(self, req, res):
+            nonlocal called
+            called = True
+
+        async def post(self, req, res):
+            nonlocal called
+            called = True
+
+    response = client.options("/")
+    assert response.status_code == 200
+    assert response.headers["allow"] == "GET, HEAD, OPTIONS, POST"
+    assert response.text == ""
+    assert not called
+
+
+def test_options_handler_is_used_if_implemented(app: App, client):
+    @app.route("/", methods=["get", "options"])
+    async def index(req, res):
+        res.text = "Custom"
+
+    response = client.options("/")
+    assert response.status_code == 200
+    assert response.text == "Custom"
 
 
 def test_if_get_implemented_then_head_mapped(app: App, client):
@@ -1,6 +1,7 @@
 import pytest
 
 from bocadillo import App
+from bocadillo.compat import WSGIAdapter
 
 
 @pytest.mark.parametrize("path", ["/other", "/other/foo"])
@@ -35,3 +36,60 @@ def test_mount_route_parameter(app, client):
 
     r = client.get("/other/items/12")
     assert r.json() == {"pk": 12}
+
+
+def test_mount_wsgi_app(app: App, client):
+    def wsgi_app(environ, start_response):
+        start_response("200 OK", [("content-type", "text/plain")])
+        return [b"Hello, ", environ["PATH_INFO"].encode()]
+
+    app.mount("/wsgi", wsgi_app)
+
+    r = client.get("/wsgi/foo")
+    assert r.status_code == 200
+    assert r.text == "Hello, /foo"
+
+
+def test_wsgi_app_is_detected_once(app: App):
+    class WSGIApp:
+        def __call__(self, environ, start_response):
+            pass
+
+    asgi = App()
+    app.mount("/wsgi", WSGIApp())
+    app.mount("/asgi", asgi)
+
+    wsgi_route, asgi_route = app.router.routes[-2:]
+    assert isinstance(wsgi_route._asgi, WSGIAdapter)
+    assert asgi_route._asgi is asgi
+
+
+def test_wsgi_iterable_is_closed(app: App, client):
+    closed = False
+
+    class Body:
+        def __iter__(self):
+            yield b"foo"
+
+        def close(self):
+            nonlocal closed
+            closed = True
+
+    def wsgi_app(environ, start_response):
+        start_response("200 OK", [])
+        return Body()
+
+    app.mount("/wsgi", wsgi_app)
+
+    assert client.get("/wsgi").text == "foo"
+    assert closed
+
+
+def test_type_error_in_mounted_asgi_app_is_not_masked(app: App, client):
+    async def asgi_app(scope, receive, send):
+        raise TypeError("oops")
+
+    app.mount("/asgi", asgi_app)
+
+    with pytest.raises(TypeError, match="oops"):
+        client.get("/asgi/")
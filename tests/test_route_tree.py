@@ -0,0 +1,97 @@
+import pytest
+
+from bocadillo import App, Router, configure, create_client
+from bocadillo.routing import HTTPRoute, Mount, RouteList, RouteRegex, RouteTree
+
+PATTERNS = [
+    "/",
+    "/items",
+    "/items/",
+    "/items/{pk}",
+    "/items/42",
+    "/items/{pk}/detail",
+    "/items/{}",
+    "/files/{location:path}",
+    "/foo/{}-bar",
+    "/robots.txt",
+    "{}",
+]
+
+PATHS = [
+    "/",
+    "/items",
+    "/items/",
+    "/items/42",
+    "/items/13",
+    "/items/13/detail",
+    "/items/13/other",
+    "/files/",
+    "/files/a/b.png",
+    "/foo/no-bar",
+    "/robots.txt",
+    "/unknown",
+]
+
+
+@pytest.mark.parametrize("matcher_cls", [RouteTree, RouteRegex])
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize("offset", range(len(PATTERNS)))
+def test_matches_like_linear_scan(matcher_cls, path, offset):
+    # Rotate patterns to check that the first registered route always wins.
+    patterns = PATTERNS[offset:] + PATTERNS[:offset]
+    routes = [HTTPRoute(pattern, view=None) for pattern in patterns]
+    routes.insert(offset, Mount("/items", app=None))
+    scope = {"type": "http", "path": path}
+    assert matcher_cls(routes).find(scope) == RouteList(routes).find(scope)
+
+
+@pytest.mark.parametrize("matcher", ["tree", "regex", "linear"])
+def test_route_matcher_setting(raw_app: App, matcher):
+    app = configure(raw_app, route_matcher=matcher)
+    client = create_client(app)
+
+    @app.route("/items/{pk}")
+    async def get_item(req, res, pk: int):
+        res.json = {"pk": pk}
+
+    @app.route("/items/{}")
+    async def other(req, res):
+        res.json = {}
+
+    assert client.get("/items/12").json() == {"pk": 12}
+    assert client.get("/items/12/foo").json() == {}
+    assert client.get("/foo").status_code == 404
+
+
+def test_unknown_route_matcher():
+    with pytest.raises(ValueError):
+        Router(matcher="unknown")
+
+
+def test_route_registered_after_first_request_is_found(app: App, client):
+    @app.route("/foo")
+    async def foo(req, res):
+        pass
+
+    assert client.get("/foo").status_code == 200
+    assert client.get("/bar").status_code == 404
+
+    @app.route("/bar")
+    async def bar(req, res):
+        pass
+
+    assert client.get("/bar").status_code == 200
+
+
+def test_http_and_websocket_routes_do_not_shadow_each_other(app: App, client):
+    @app.websocket_route("/echo")
+    async def echo_ws(ws):
+        await ws.send("ws")
+
+    @app.route("/echo")
+    async def echo(req, res):
+        res.text = "http"
+
+    assert client.get("/echo").text == "http"
+    with client.websocket_connect("/echo") as ws:
+        assert ws.receive_text() == "ws"
@@ -155,3 +155,83 @@ def test_include_router_nested_apps(app, client, path, status):
     app.include_router(router, prefix="/tacos")
 
     assert client.get(path).status_code == status
+
+
+def test_route_lookups_are_cached(app, client):
+    @app.route("/items/{pk}")
+    async def get_item(req, res, pk: int):
+        res.json = {"pk": pk}
+
+    assert client.get("/items/1").json() == {"pk": 1}
+    assert client.get("/items/1").json() == {"pk": 1}
+    assert client.get("/items/2").json() == {"pk": 2}
+
+    info = app.router.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_route_not_found_is_cached(app, client):
+    assert client.get("/foo", allow_redirects=False).status_code == 404
+    assert client.get("/foo", allow_redirects=False).status_code == 404
+    # Both the requested path and its trailing slash redirect are cached.
+    info = app.router.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+
+def test_route_cache_is_invalidated_when_routes_change(app, client):
+    assert client.get("/foo/").status_code == 404
+
+    @app.route("/foo/")
+    async def foo(req, res):
+        pass
+
+    assert client.get("/foo/").status_code == 200
+    assert client.get("/foo", allow_redirects=False).status_code == 302
+
+    router = Router()
+
+    @router.route("/bar")
+    async def bar(req, res):
+        pass
+
+    app.include_router(router, prefix="/foo")
+    assert client.get("/foo/bar").status_code == 200
+
+
+def test_route_cache_evicts_least_recently_used(raw_app):
+    app = configure(raw_app, route_cache_size=2)
+    client = create_client(app)
+
+    @app.route("/{name}")
+    async def index(req, res, name):
+        pass
+
+    for path in "/a", "/b", "/a", "/c", "/a":
+        client.get(path)
+
+    info = app.router.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (2, 3, 2)
+    assert info.currsize == 2
+
+
+def test_route_cache_can_be_disabled(raw_app):
+    app = configure(raw_app, route_cache_size=0)
+    client = create_client(app)
+
+    @app.route("/")
+    async def index(req, res):
+        pass
+
+    client.get("/")
+    client.get("/")
+    assert app.router.cache_info().currsize == 0
+
+
+def test_cached_path_params_are_not_shared(app, client):
+    @app.route("/{name}")
+    async def index(req, res, name):
+        req.path_params["name"] = "altered"
+        res.text = name
+
+    assert client.get("/foo").text == "foo"
+    assert client.get("/foo").text == "foo"
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from bocadillo import App, HTTPError
+from bocadillo.middleware import SingleFlightMiddleware
+
+
+async def request(app: App, path: str = "/", method: str = "GET", headers=()):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": list(headers),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start, *body = messages
+    return start["status"], b"".join(
+        message.get("body", b"") for message in body
+    )
+
+
+@pytest.fixture(name="gate")
+def fixture_gate():
+    return asyncio.Event()
+
+
+@pytest.fixture(name="calls")
+def fixture_calls():
+    return []
+
+
+@pytest.fixture(name="slow_app")
+def fixture_slow_app(app: App, gate: asyncio.Event, calls: list) -> App:
+    app.add_middleware(SingleFlightMiddleware)
+
+    @app.route("/")
+    class Index:
+        async def get(self, req, res):
+            calls.append(req.method)
+            await gate.wait()
+            res.text = f"calls: {len(calls)}"
+
+        async def post(self, req, res):
+            calls.append(req.method)
+            await gate.wait()
+
+    @app.route("/fail")
+    async def fail(req, res):
+        calls.append(req.method)
+        await gate.wait()
+        raise HTTPError(503)
+
+    return app
+
+
+async def _concurrently(gate: asyncio.Event, *coros):
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    await asyncio.sleep(0.01)
+    gate.set()
+    return await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_coalesced(slow_app, gate, calls):
+    responses = await _concurrently(
+        gate, *(request(slow_app) for _ in range(5))
+    )
+    assert calls == ["GET"]
+    assert responses == [(200, b"calls: 1")] * 5
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_coalesced(slow_app, gate, calls):
+    await _concurrently(
+        gate,
+        request(slow_app),
+        request(slow_app, headers=[(b"cookie", b"session=1")]),
+        request(slow_app, method="POST"),
+        request(slow_app, method="POST"),
+    )
+    assert sorted(calls) == ["GET", "GET", "POST", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_subsequent_requests_are_not_coalesced(slow_app, gate, calls):
+    gate.set()
+    assert await request(slow_app) == (200, b"calls: 1")
+    assert await request(slow_app) == (200, b"calls: 2")
+
+
+@pytest.mark.asyncio
+async def test_errors_are_propagated(slow_app, gate, calls):
+    responses = await _concurrently(
+        gate, *(request(slow_app, "/fail") for _ in range(3))
+    )
+    assert calls == ["GET"]
+    assert [status for status, _ in responses] == [503] * 3
+
+
+@pytest.mark.asyncio
+async def test_custom_key(app: App, gate, calls):
+    app.add_middleware(SingleFlightMiddleware, key=lambda req: None)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.method)
+        await gate.wait()
+
+    await _concurrently(gate, request(app), request(app))
+    assert calls == ["GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_timeout(app: App, gate, calls):
+    app.add_middleware(SingleFlightMiddleware, timeout=0.001)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.method)
+        await gate.wait()
+
+    await _concurrently(gate, request(app), request(app))
+    assert calls == ["GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_responses_are_not_reused(app: App, gate, calls):
+    app.add_middleware(SingleFlightMiddleware)
+
+    @app.route("/")
+    async def index(req, res):
+        calls.append(req.method)
+        await gate.wait()
+
+        @res.stream
+        async def stream():
+            yield "foo"
+
+    responses = await _concurrently(gate, request(app), request(app))
+    assert calls == ["GET", "GET"]
+    assert responses == [(200, b"foo")] * 2
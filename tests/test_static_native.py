@@ -0,0 +1,184 @@
+import gzip
+
+import pytest
+
+from bocadillo import App, configure, create_client, static
+from bocadillo.staticfiles import StaticFiles
+
+CONTENTS = "console.log('foo!');"
+
+
+@pytest.fixture
+def static_dir(tmpdir_factory):
+    static_dir = tmpdir_factory.mktemp("static")
+    static_dir.mkdir("js").join("foo.js").write(CONTENTS)
+    return static_dir
+
+
+@pytest.fixture
+def app(raw_app: App, static_dir) -> App:
+    return configure(
+        raw_app,
+        static_dir=str(static_dir),
+        static_config={"backend": "native"},
+    )
+
+
+@pytest.fixture
+def client(app: App):
+    return create_client(app)
+
+
+def test_backend_is_selected_with_static_config(app: App):
+    route = next(
+        route
+        for route in app.router.routes
+        if getattr(route, "path", None) == "/static"
+    )
+    assert isinstance(route.app, StaticFiles)
+
+
+def test_unknown_backend(static_dir):
+    with pytest.raises(ValueError):
+        static(str(static_dir), backend="unknown")
+
+
+def test_serve_file(client):
+    r = client.get("/static/js/foo.js")
+    assert r.status_code == 200
+    assert r.text == CONTENTS
+    assert "javascript" in r.headers["content-type"]
+    assert r.headers["content-length"] == str(len(CONTENTS))
+    assert r.headers["cache-control"] == "max-age=60, public"
+    assert "etag" in r.headers
+    assert "last-modified" in r.headers
+
+
+def test_head(client):
+    r = client.head("/static/js/foo.js")
+    assert r.status_code == 200
+    assert r.headers["content-length"] == str(len(CONTENTS))
+    assert r.text == ""
+
+
+@pytest.mark.parametrize("path", ["/static/js/bar.js", "/static/js"])
+def test_not_found(client, path):
+    assert client.get(path).status_code == 404
+
+
+def test_path_outside_root_is_not_served(static_dir):
+    static_dir.join("secret.txt").write("secret")
+    app = StaticFiles(str(static_dir.join("js")), autorefresh=True)
+    assert app.find("/../secret.txt") is None
+    assert app.find("/foo.js") is not None
+
+
+def test_method_not_allowed(client):
+    r = client.post("/static/js/foo.js")
+    assert r.status_code == 405
+    assert r.headers["allow"] == "GET, HEAD"
+
+
+def test_files_are_indexed_at_startup(app: App, client, static_dir):
+    static_dir.join("js", "bar.js").write("bar")
+    assert client.get("/static/js/bar.js").status_code == 404
+
+
+def test_autorefresh(raw_app: App, static_dir):
+    app = configure(raw_app, static_dir=None)
+    app.mount(
+        "/assets", static(str(static_dir), backend="native", autorefresh=True)
+    )
+    client = create_client(app)
+
+    static_dir.join("js", "bar.js").write("bar")
+    assert client.get("/assets/js/bar.js").text == "bar"
+
+
+def test_precompressed_variant(static_dir):
+    compressed = gzip.compress(CONTENTS.encode())
+    static_dir.join("js", "foo.js.gz").write_binary(compressed)
+    app = App()
+    app.mount("/assets", static(str(static_dir), backend="native"))
+    client = create_client(app)
+
+    r = client.get("/assets/js/foo.js", headers={"accept-encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["vary"] == "accept-encoding"
+    assert "javascript" in r.headers["content-type"]
+    assert r.text == CONTENTS  # Decoded by the client.
+
+    r = client.get("/assets/js/foo.js", headers={"accept-encoding": "gzip;q=0"})
+    assert "content-encoding" not in r.headers
+    assert r.text == CONTENTS
+
+
+@pytest.mark.parametrize("header", ["if-none-match", "if-modified-since"])
+def test_not_modified(client, header):
+    r = client.get("/static/js/foo.js")
+    value = r.headers["etag" if header == "if-none-match" else "last-modified"]
+
+    r = client.get("/static/js/foo.js", headers={header: value})
+    assert r.status_code == 304
+    assert r.text == ""
+
+
+def test_modified(client):
+    r = client.get("/static/js/foo.js", headers={"if-none-match": '"other"'})
+    assert r.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "value, content_range, body",
+    [
+        ("bytes=0-6", "bytes 0-6/20", CONTENTS[:7]),
+        ("bytes=12-", "bytes 12-19/20", CONTENTS[12:]),
+        ("bytes=-3", "bytes 17-19/20", CONTENTS[-3:]),
+        ("bytes=12-100", "bytes 12-19/20", CONTENTS[12:]),
+    ],
+)
+def test_range(client, value, content_range, body):
+    r = client.get("/static/js/foo.js", headers={"range": value})
+    assert r.status_code == 206
+    assert r.headers["content-range"] == content_range
+    assert r.headers["content-length"] == str(len(body))
+    assert r.text == body
+
+
+def test_range_not_satisfiable(client):
+    r = client.get("/static/js/foo.js", headers={"range": "bytes=100-"})
+    assert r.status_code == 416
+    assert r.headers["content-range"] == "bytes */20"
+
+
+def test_invalid_range_is_ignored(client):
+    r = client.get("/static/js/foo.js", headers={"range": "foo"})
+    assert r.status_code == 200
+    assert r.text == CONTENTS
+
+
+def test_chunked_file(static_dir):
+    app = App()
+    app.mount(
+        "/assets", static(str(static_dir), backend="native", chunk_size=3)
+    )
+    client = create_client(app)
+    assert client.get("/assets/js/foo.js").text == CONTENTS
+
+
+def test_multiple_ranges(client):
+    r = client.get("/static/js/foo.js", headers={"range": "bytes=0-1,4-5"})
+    assert r.status_code == 206
+    assert r.headers["content-type"].startswith("multipart/byteranges")
+    assert r.headers["content-length"] == str(len(r.content))
+    assert "content-range: bytes 4-5/20\r\n\r\nol\r\n" in r.text
+
+
+def test_if_range(client):
+    etag = client.get("/static/js/foo.js").headers["etag"]
+
+    headers = {"range": "bytes=0-6", "if-range": etag}
+    assert client.get("/static/js/foo.js", headers=headers).status_code == 206
+
+    headers = {"range": "bytes=0-6", "if-range": '"other"'}
+    assert client.get("/static/js/foo.js", headers=headers).status_code == 200
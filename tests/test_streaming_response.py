@@ -6,6 +6,7 @@ import pytest
 import requests
 
 from bocadillo import App, ClientDisconnect, LiveServer
+from bocadillo.streaming import FLUSH, buffer_stream
 
 from .utils import stops_incrementing
 
@@ -100,3 +101,65 @@ def test_raise_on_disconnect(app: App):
         r.close()
         sync_sleep(0.1)
         assert caught.value
+
+
+def test_chunks_are_buffered(app: App, client):
+    @app.route("/")
+    async def index(req, res):
+        @res.stream(buffer_size=4)
+        async def stream():
+            for character in "hello":
+                yield character
+
+    r = client.get("/")
+    assert r.text == "hello"
+
+
+@pytest.mark.asyncio
+async def test_buffer_stream_flushes_on_size():
+    async def source():
+        for chunk in ("ab", b"cd", "e"):
+            yield chunk
+
+    chunks = [c async for c in buffer_stream(source(), 4, None)]
+    assert chunks == [b"abcd", b"e"]
+
+
+@pytest.mark.asyncio
+async def test_buffer_stream_flushes_on_flush_marker():
+    async def source():
+        yield "a"
+        yield FLUSH
+        yield FLUSH
+        yield "b"
+
+    chunks = [c async for c in buffer_stream(source(), 4096, None)]
+    assert chunks == [b"a", b"b"]
+
+
+@pytest.mark.asyncio
+async def test_buffer_stream_flushes_on_interval():
+    released = False
+
+    async def source():
+        nonlocal released
+        yield "a"
+        await sleep(0.1)
+        released = True
+        yield "b"
+
+    stream = buffer_stream(source(), 4096, 0.01)
+    assert await stream.__anext__() == b"a"
+    assert not released
+    assert await stream.__anext__() == b"b"
+
+
+@pytest.mark.asyncio
+async def test_unbuffered_stream_passes_chunks_through():
+    async def source():
+        yield "a"
+        yield FLUSH
+        yield b"b"
+
+    chunks = [c async for c in buffer_stream(source(), 0, None)]
+    assert chunks == ["a", b"b"]
@@ -0,0 +1,133 @@
+import pytest
+
+from bocadillo import App, Router
+
+
+def test_url_for(app: App):
+    @app.route("/items/{pk:int}", name="item")
+    async def get_item(req, res, pk):
+        pass
+
+    assert app.url_for("item", pk=42) == "/items/42"
+
+
+def test_name_defaults_to_view_name(app: App):
+    @app.route("/")
+    async def index(req, res):
+        pass
+
+    @app.route("/about")
+    class About:
+        async def get(self, req, res):
+            pass
+
+    @app.websocket_route("/chat/{room}")
+    async def chat(ws, room):
+        pass
+
+    assert app.url_for("index") == "/"
+    assert app.url_for("About") == "/about"
+    assert app.url_for("chat", room="general") == "/chat/general"
+
+
+def test_first_registered_route_wins(app: App):
+    @app.route("/foo", name="foo")
+    async def foo(req, res):
+        pass
+
+    @app.route("/bar", name="foo")
+    async def bar(req, res):
+        pass
+
+    assert app.url_for("foo") == "/foo"
+
+
+def test_url_for_path_converter(app: App):
+    @app.route("/files/{location:path}")
+    async def get_file(req, res, location):
+        pass
+
+    assert app.url_for("get_file", location="a/b.png") == "/files/a/b.png"
+
+
+def test_url_for_included_router(app: App, client):
+    router = Router()
+
+    @router.route("/{pk:int}")
+    async def get_taco(req, res, pk):
+        res.json = {"pk": pk}
+
+    app.include_router(router, prefix="/tacos")
+
+    url = app.url_for("get_taco", pk=1)
+    assert url == "/tacos/1"
+    assert client.get(url).json() == {"pk": 1}
+
+
+def test_url_for_mounted_app(app: App):
+    other = App()
+
+    @other.route("/items/{pk}")
+    async def get_item(req, res, pk):
+        pass
+
+    app.mount("/other", other, name="other")
+
+    assert app.url_for("other:get_item", pk=1) == "/other/items/1"
+    assert app.url_for("other", path="foo") == "/other/foo"
+    with pytest.raises(LookupError):
+        app.url_for("get_item", pk=1)
+
+
+def test_url_for_unnamed_mounted_app(app: App):
+    other = App()
+
+    @other.route("/items/{pk}")
+    async def get_item(req, res, pk):
+        pass
+
+    app.mount("/other", other)
+
+    assert app.url_for("get_item", pk=1) == "/other/items/1"
+
+
+def test_url_for_static_files(app: App):
+    assert app.url_for("static", path="css/app.css") == "/static/css/app.css"
+
+
+def test_url_for_route_added_later(app: App):
+    @app.route("/foo")
+    async def foo(req, res):
+        pass
+
+    assert app.url_for("foo") == "/foo"
+
+    @app.route("/bar")
+    async def bar(req, res):
+        pass
+
+    assert app.url_for("bar") == "/bar"
+
+
+def test_unknown_route_name(app: App):
+    with pytest.raises(LookupError):
+        app.url_for("unknown")
+
+
+@pytest.mark.parametrize("params", [{}, {"pk": 1, "other": 2}])
+def test_invalid_parameters(app: App, params: dict):
+    @app.route("/items/{pk}")
+    async def get_item(req, res, pk):
+        pass
+
+    with pytest.raises(TypeError):
+        app.url_for("get_item", **params)
+
+
+def test_anonymous_parameters_cannot_be_reversed(app: App):
+    @app.route("/foo/{}")
+    async def foo(req, res):
+        pass
+
+    with pytest.raises(TypeError):
+        app.url_for("foo")